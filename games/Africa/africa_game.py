@@ -2,6 +2,9 @@ import arcade
 import os
 import random
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.frame_cache import frame_cache
+from games.Africa.fruit_storm import FruitStorm
 from PIL import Image
 from arcade import Rect
 
@@ -9,11 +12,40 @@ from arcade import Rect
 MAX_FRUIT = 10
 GAME_DURATION = 30.0 # seconds
 MAX_SCORE = 5
+FRUIT_ROWS, FRUIT_COLS = 3, 3
+FRUIT_SCALE = 0.6
+# Fruit sprites ever alive at once; a fruit falls for ~2.5 s and one spawns every 0.8 s
+FRUIT_POOL_SIZE = 16
+# Fruit falling at once in the fruit storm stress mode
+STORM_FRUIT = 5000
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+FRUIT_PATH = os.path.join(ASSETS_DIR, "fruit.png")
+BACKGROUND_PATH = os.path.join(ASSETS_DIR, "savanaBG.png")
+ZEBRA_PATH = os.path.join(ASSETS_DIR, "zebraS.png")
+
+def resized_background(path, size):
+    """Cache key and PIL factory for the background scaled to the window size."""
+    def scale_background():
+        key = frame_cache.key(path, resample=Image.Resampling.BICUBIC, size=size)
+        return frame_cache.get_or_create(key, lambda: assets.load_image(path).resize(size, Image.Resampling.BICUBIC))
+    return f"{path}:{size[0]}x{size[1]}", scale_background
+
+def fruit_frame_size(path):
+    """Size of one cell of the 3x3 fruit sheet, read from the file header only."""
+    with Image.open(path) as sheet:
+        width, height = sheet.size
+    return width // FRUIT_COLS, height // FRUIT_ROWS
 
 class AfricaGame(IGame, arcade.View):
-    def __init__(self):
+    NAME = "Africa Fruit Catcher"
+    COLOR = (255, 255, 0)
+
+    def __init__(self, storm_size=0, fruit_goal=MAX_FRUIT):
         super().__init__()
-        self.title = "Africa Fruit Catcher"
+        self.title = self.NAME
+        self.storm_size = storm_size
+        self.fruit_goal = fruit_goal
         self.window = arcade.get_window() # Get window early for dimensions
         if not self.window:
              # Fallback dimensions if window doesn't exist yet (e.g., during testing)
@@ -24,7 +56,7 @@ class AfricaGame(IGame, arcade.View):
              self._window_width = self.window.width
              self._window_height = self.window.height
 
-        self.assets_dir = os.path.join(os.path.dirname(__file__), "assets")
+        self.assets_dir = ASSETS_DIR
         self._load_assets()
         self._setup_sprites()
         self._setup_text()
@@ -34,10 +66,9 @@ class AfricaGame(IGame, arcade.View):
         """Load textures and sounds."""
         # Load and resize background
         try:
-            bg_path = os.path.join(self.assets_dir, "savanaBG.png")
-            pil_bg = Image.open(bg_path).convert("RGBA").resize((self._window_width, self._window_height))
-            self.bg_texture = arcade.Texture.create_empty("bg_resized", (self._window_width, self._window_height))
-            self.bg_texture.image = pil_bg
+            bg_path = BACKGROUND_PATH
+            size = (self._window_width, self._window_height)
+            self.bg_texture = assets.get_texture(*resized_background(bg_path, size))
         except FileNotFoundError:
             print(f"Error: Background file not found at {bg_path}")
             self.bg_texture = None
@@ -45,22 +76,21 @@ class AfricaGame(IGame, arcade.View):
             print(f"Error loading/resizing background: {e}")
             self.bg_texture = None
 
-        # Load fruit spritesheet info (3 rows x 3 cols)
+        # Slice the fruit spritesheet (3 rows x 3 cols) into nine shared textures, once
         try:
-            fruit_path = os.path.join(self.assets_dir, "fruit.png")
-            self.fruit_image, self.fruit_w, self.fruit_h, self.fruit_rows, self.fruit_cols = self.load_fruit_info(fruit_path)
+            self.fruit_textures = self.load_fruit_textures(FRUIT_PATH)
         except FileNotFoundError:
-             print(f"Error: Fruit spritesheet not found at {fruit_path}")
-             self.fruit_image = None # Handle missing spritesheet
+             print(f"Error: Fruit spritesheet not found at {FRUIT_PATH}")
+             self.fruit_textures = None # Handle missing spritesheet
         except Exception as e:
-             print(f"Error loading fruit info: {e}")
-             self.fruit_image = None
+             print(f"Error loading fruit textures: {e}")
+             self.fruit_textures = None
 
     def _setup_sprites(self):
         """Create sprite lists and player sprite."""
         # Load zebra
         try:
-            self.zebra_sprite = arcade.Sprite(os.path.join(self.assets_dir, "zebraS.png"), scale=0.3)
+            self.zebra_sprite = arcade.Sprite(assets.load_texture(ZEBRA_PATH), scale=0.3)
         except FileNotFoundError:
              print("Error: Zebra sprite not found. Using placeholder.")
              self.zebra_sprite = arcade.SpriteCircle(30, arcade.color.GRAY) # Placeholder
@@ -71,7 +101,24 @@ class AfricaGame(IGame, arcade.View):
         self.zebra_list = arcade.SpriteList()
         self.zebra_list.append(self.zebra_sprite)
 
-        self.fruit_list = arcade.SpriteList()
+        # Falling fruit are recycled through a fixed pool; it outlives runs
+        if not hasattr(self, 'fruit_list'):
+            self.fruit_list = arcade.SpriteList(capacity=FRUIT_POOL_SIZE)
+            self.fruit_pool = []
+            if self.fruit_textures:
+                self.fruit_pool = [arcade.Sprite(self.fruit_textures[0], scale=FRUIT_SCALE)
+                                   for _ in range(FRUIT_POOL_SIZE)]
+
+        # The fruit storm replaces the pooled fruit with thousands of array-driven ones
+        if not hasattr(self, 'fruit_storm'):
+            self.fruit_storm = None
+            if self.storm_size and self.fruit_textures:
+                try:
+                    self.fruit_storm = FruitStorm(self.fruit_textures, self.storm_size,
+                                                  self._window_width, self._window_height, FRUIT_SCALE,
+                                                  seed=random.getrandbits(32))
+                except ImportError as e:
+                    print(f"Warning: {e}. Playing without the fruit storm.")
 
     def _setup_text(self):
         """Initialize text objects."""
@@ -98,8 +145,11 @@ class AfricaGame(IGame, arcade.View):
         self.fruit_spawn_interval = 0.8
         self.held_keys = set()
 
-        # Clear sprite lists
-        self.fruit_list.clear()
+        # Return every falling fruit to the pool
+        while self.fruit_list:
+            self._release_fruit(self.fruit_list[-1])
+        if self.fruit_storm:
+            self.fruit_storm.reset()
 
         # Reset zebra position
         self.zebra_sprite.center_x = self._window_width // 2
@@ -111,8 +161,16 @@ class AfricaGame(IGame, arcade.View):
         self.game_over_display_text.text = ""
 
 
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode the sprites and scale the background on the asset prefetch workers."""
+        if window_size:
+            assets.prefetch(*resized_background(BACKGROUND_PATH, window_size))
+        assets.prefetch_grid(FRUIT_PATH, fruit_frame_size(FRUIT_PATH), FRUIT_COLS, FRUIT_ROWS * FRUIT_COLS)
+        assets.prefetch_file(ZEBRA_PATH)
+
     def get_name(self):
-        return self.title
+        return self.NAME
 
     def run(self, window):
         """Called by the menu to start the game."""
@@ -143,6 +201,8 @@ class AfricaGame(IGame, arcade.View):
         # Draw game elements
         self.zebra_list.draw()
         self.fruit_list.draw()
+        if self.fruit_storm:
+            self.fruit_storm.draw()
 
         # Draw UI text
         self.fruit_count_text.draw()
@@ -168,6 +228,10 @@ class AfricaGame(IGame, arcade.View):
 
         # Game logic
         self.handle_input()
+        if self.fruit_storm:
+            self.fruit_count += self.fruit_storm.update(delta_time, self.zebra_sprite)
+            self.check_win()
+            return
         self.spawn_fruit(delta_time)
         self.fruit_list.update()
         self.check_catch()
@@ -202,50 +266,47 @@ class AfricaGame(IGame, arcade.View):
 
     def spawn_fruit(self, delta_time):
         """Spawn a random fruit if the timer allows."""
-        if not self.fruit_image: return # Don't spawn if spritesheet failed to load
+        if not self.fruit_textures: return # Don't spawn if spritesheet failed to load
 
         self.fruit_spawn_timer += delta_time
         if self.fruit_spawn_timer >= self.fruit_spawn_interval:
             self.fruit_spawn_timer = 0
-            row = random.randint(0, self.fruit_rows - 1)
-            col = random.randint(0, self.fruit_cols - 1)
-            left = col * self.fruit_w
-            upper = row * self.fruit_h
-            right = left + self.fruit_w
-            lower = upper + self.fruit_h
-
-            try:
-                frame_img = self.fruit_image.crop((left, upper, right, lower))
-                texture = arcade.Texture.create_empty(f"fruit_{row}_{col}", (self.fruit_w, self.fruit_h))
-                texture.image = frame_img
-
-                fruit = arcade.Sprite()
-                fruit.texture = texture
-                fruit.center_x = random.randint(40, self._window_width - 40)
-                fruit.center_y = self._window_height + 30
-                fruit.change_y = -random.uniform(4, 7) # Speed
-                fruit.scale = 0.6
-                self.fruit_list.append(fruit)
-            except Exception as e:
-                 print(f"Error creating fruit sprite from image: {e}")
-
+            row = random.randint(0, FRUIT_ROWS - 1)
+            col = random.randint(0, FRUIT_COLS - 1)
+            if not self.fruit_pool:
+                return # Every pooled fruit is already falling
+
+            fruit = self.fruit_pool.pop()
+            fruit.texture = self.fruit_textures[row * FRUIT_COLS + col]
+            fruit.center_x = random.randint(40, self._window_width - 40)
+            fruit.center_y = self._window_height + 30
+            fruit.change_y = -random.uniform(4, 7) # Speed
+            self.fruit_list.append(fruit)
+
+    def _release_fruit(self, fruit):
+        """Take a fruit off the screen and hand it back to the pool."""
+        self.fruit_list.remove(fruit)
+        self.fruit_pool.append(fruit)
 
     def check_catch(self):
         """Check if the zebra caught any fruit."""
         caught = arcade.check_for_collision_with_list(self.zebra_sprite, self.fruit_list)
         for fruit in caught:
             self.fruit_count += 1
-            fruit.remove_from_sprite_lists()
+            self._release_fruit(fruit)
+        self.check_win()
 
-        # Check for win condition
-        if self.fruit_count >= MAX_FRUIT:
+    def check_win(self):
+        """End the game once enough fruit were caught."""
+        if self.fruit_count >= self.fruit_goal:
             self.end_game() # Reached max fruit
 
     def remove_missed_fruit(self):
         """Remove fruit that falls off the bottom."""
-        for fruit in self.fruit_list:
-            if fruit.top < 0: # Use top for removal check
-                fruit.remove_from_sprite_lists()
+        # Collect first: removing from the SpriteList while iterating it skips the next fruit
+        missed = [fruit for fruit in self.fruit_list if fruit.top < 0] # Use top for removal check
+        for fruit in missed:
+            self._release_fruit(fruit)
 
     def end_game(self):
         """Set game over state and calculate final score."""
@@ -283,14 +344,9 @@ class AfricaGame(IGame, arcade.View):
             if self.window:
                 self.window.close() # Fallback
 
-    def load_fruit_info(self, path):
-        """Load PIL image and calculate frame dimensions."""
-        pil_image = Image.open(path).convert("RGBA")
-        width, height = pil_image.size
-        rows, cols = 3, 3
-        frame_width = width // cols
-        frame_height = height // rows
-        return pil_image, frame_width, frame_height, rows, cols
+    def load_fruit_textures(self, path):
+        """Slice the fruit spritesheet into one shared texture per cell, row by row."""
+        return assets.texture_grid(path, fruit_frame_size(path), FRUIT_COLS, FRUIT_ROWS * FRUIT_COLS)
 
     def get_color(self):
-        return (255, 255, 0) # Gold/yellow for Africa
+        return self.COLOR
@@ -0,0 +1,117 @@
+import arcade
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the fruit storm needs it
+    np = None
+
+FRUIT_SPEED_RANGE = (240.0, 420.0)  # pixels per second, the normal game's 4-7 px per frame at 60 FPS
+
+
+class FruitStorm:
+    """Thousands of falling fruit, simulated as NumPy arrays and drawn from one SpriteList.
+
+    Positions and velocities live in ``xs``, ``ys`` and ``vys``; each frame advances
+    them in one vectorized step. A fruit that reaches the zebra's band or falls below
+    the screen is respawned at the top by a single mask operation, so the sprite list
+    never changes size. Positions are then copied into the SpriteList's vertex data in
+    bulk, without going through each sprite's position setter, when that private buffer
+    has the layout this was written against (see ``_can_write_buffer``); the sprites' own
+    ``center_x``/``center_y`` are then not kept up to date, only the arrays are. Otherwise
+    every sprite is moved through its public ``position``.
+    """
+
+    def __init__(self, textures, count: int, width: int, height: int, scale: float, seed=None):
+        if np is None:
+            raise ImportError("the fruit storm needs numpy (pip install numpy)")
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.half_width = textures[0].width * scale / 2
+        self.half_height = textures[0].height * scale / 2
+
+        # Each fruit keeps the texture it was given; only its position is ever rewritten
+        self.sprite_list = arcade.SpriteList(capacity=count)
+        for index in self.rng.integers(0, len(textures), count):
+            self.sprite_list.append(arcade.Sprite(textures[index], scale=scale))
+        self.slots = np.array([self.sprite_list.sprite_slot[sprite] for sprite in self.sprite_list], dtype=np.intp)
+
+        self.xs = np.zeros(count, dtype=np.float32)
+        self.ys = np.zeros(count, dtype=np.float32)
+        self.vys = np.zeros(count, dtype=np.float32)
+        # Scratch buffers for the per-frame step and masks; only respawning fruit allocate
+        self.step = np.zeros(count, dtype=np.float32)
+        self.caught = np.zeros(count, dtype=bool)
+        self.recycle = np.zeros(count, dtype=bool)
+        self.bulk_write = self._can_write_buffer()
+        if count and not self.bulk_write:
+            print(f"Warning: arcade {arcade.version.VERSION} changed its SpriteList buffers, "
+                  "the fruit storm falls back to moving each sprite")
+        self.reset()
+
+    def __len__(self):
+        return len(self.xs)
+
+    def reset(self):
+        """Scatter every fruit above the screen so they arrive as a steady stream."""
+        count = len(self.xs)
+        self.xs[:] = self.rng.uniform(40, self.width - 40, count)
+        self.ys[:] = self.rng.uniform(self.height + 30, self.height * 3, count)
+        self.vys[:] = -self.rng.uniform(*FRUIT_SPEED_RANGE, count)
+        self.write_back()
+
+    def update(self, delta_time: float, zebra: arcade.Sprite) -> int:
+        """Advance every fruit, recycle the caught and missed ones. Returns how many were caught."""
+        xs, ys, caught, recycle = self.xs, self.ys, self.caught, self.recycle
+        np.multiply(self.vys, delta_time, out=self.step)
+        ys += self.step
+
+        # A fruit is caught when its center is inside the zebra's box grown by half a fruit
+        np.greater_equal(xs, zebra.left - self.half_width, out=caught)
+        caught &= np.less_equal(xs, zebra.right + self.half_width, out=recycle)
+        caught &= np.greater_equal(ys, zebra.bottom - self.half_height, out=recycle)
+        caught &= np.less_equal(ys, zebra.top + self.half_height, out=recycle)
+        caught_count = int(np.count_nonzero(caught))
+        # Missed once its top is below the screen
+        np.less(ys, -self.half_height, out=recycle)
+        recycle |= caught
+        respawned = int(np.count_nonzero(recycle))
+        if respawned:
+            xs[recycle] = self.rng.uniform(40, self.width - 40, respawned)
+            ys[recycle] = self.height + 30
+            self.vys[recycle] = -self.rng.uniform(*FRUIT_SPEED_RANGE, respawned)
+
+        self.write_back()
+        return caught_count
+
+    def _can_write_buffer(self) -> bool:
+        """Whether positions can go straight into the SpriteList's private position buffer.
+
+        In arcade 3 it is a float array with x, y, depth and angle for each slot. That is
+        not public API, so the version is checked and a sprite is moved through its public
+        setter to make sure its position lands where write_back expects it.
+        """
+        sprite_list = self.sprite_list
+        data = getattr(sprite_list, "_sprite_pos_angle_data", None)
+        if (not arcade.version.VERSION.startswith("3.") or getattr(data, "typecode", None) != "f"
+                or not hasattr(sprite_list, "_sprite_pos_angle_changed") or not len(sprite_list)):
+            return False
+        sprite = sprite_list[0]
+        sprite.position = (12.5, 34.25)
+        slot = sprite_list.sprite_slot[sprite]
+        return len(data) >= 4 * len(sprite_list) and data[slot * 4] == 12.5 and data[slot * 4 + 1] == 34.25
+
+    def write_back(self):
+        """Copy the positions into the SpriteList's buffer (x, y, depth, angle per slot)."""
+        sprite_list = self.sprite_list
+        if not self.bulk_write:
+            for sprite, x, y in zip(sprite_list, self.xs.tolist(), self.ys.tolist()):
+                sprite.position = (x, y)
+            return
+        pos_angle = np.frombuffer(sprite_list._sprite_pos_angle_data, dtype=np.float32).reshape(-1, 4)
+        pos_angle[self.slots, 0] = self.xs
+        pos_angle[self.slots, 1] = self.ys
+        sprite_list._sprite_pos_angle_changed = True
+
+    def draw(self):
+        self.sprite_list.draw()
@@ -1,13 +1,40 @@
 import arcade
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.frame_cache import frame_cache
+from games.hud import ShapeLayer, TextLayer
+from games.profiler import profiler
+from games.Antartica.trail import Trail
+from games.Antartica.penguin_animations import PenguinAnimations, HEAD, IDLE, WALK, SPIN, ROLL
 import os
 import PIL.Image
 import random
 
+SPRITES_DIR = os.path.join(os.path.dirname(__file__), "Spritesheets")
+# Idle, walk, turn, spin attack and roll sheets, in the order init_frames unpacks them
+SHEET_PATHS = tuple(os.path.join(SPRITES_DIR, name) for name in ("Idle.png", "Walk.png", "Turn.png", "Spin Attack.png", "Roll.png"))
+FISH_PATH = os.path.join(SPRITES_DIR, "fish.png")
+FRAME_SCALE = 2.5
+FOLLOWER_SPACING = 10  # trail positions between two penguins; adjust for more/less separation
+# Followers added up front by the "long conga" stress mode
+LONG_CONGA_LENGTH = 400
+FISH_SCALE = 0.1
+WIN_FISH = 15
+# Fish on screen at once in the "fish frenzy" variant, which has no fish goal
+FRENZY_FISH = 3000
+# Side of the fish spatial hash cells, about the size of the head's hitbox
+FISH_CELL_SIZE = 64
+
 class AntarticaGame(IGame, arcade.View):
-    def __init__(self):
+    NAME = "Antarctica Adventure"
+    COLOR = (0, 255, 255)
+
+    def __init__(self, conga_length=0, fish_pool_size=1, fish_goal=WIN_FISH):
         super().__init__()
-        self.title = "Antarctica Adventure"
+        self.title = self.NAME
+        self.conga_length = conga_length
+        self.fish_pool_size = fish_pool_size
+        self.fish_goal = fish_goal
         self.info_text = arcade.Text("Welcome to Antarctica Adventure!", 200, 550, arcade.color.WHITE, 24)
         self.init_movement()
         self.init_frames()
@@ -19,6 +46,8 @@ class AntarticaGame(IGame, arcade.View):
         self.timer_text = arcade.Text(f"Time: {int(self.timer)}", 0, 0, arcade.color.WHITE, 24, anchor_x="right")
         self.fish_text = arcade.Text(f"Fish: {self.fish_count}", 10, 0, arcade.color.WHITE, 24, anchor_x="left")
         self.score_text = arcade.Text(f"Score: {self.score}", 0, 0, arcade.color.WHITE, 24, anchor_x="center")
+        self.hud = TextLayer()
+        self.border_shapes = ShapeLayer()
         self.game_over = False
 
     def init_movement(self):
@@ -34,63 +63,57 @@ class AntarticaGame(IGame, arcade.View):
         self.current_animation = 'idle'
 
     def init_frames(self):
-        sprites_dir = os.path.join(os.path.dirname(__file__), "Spritesheets")
-        self.idle_frames = self.load_frames(os.path.join(sprites_dir, "Idle.png"), scale=2.5)
-        self.walk_frames = self.load_frames(os.path.join(sprites_dir, "Walk.png"), scale=2.5)
-        self.turn_frames = self.load_frames(os.path.join(sprites_dir, "Turn.png"), scale=2.5)
-        self.spin_frames = self.load_frames(os.path.join(sprites_dir, "Spin Attack.png"), scale=2.5)
-        self.roll_frames = self.load_frames(os.path.join(sprites_dir, "Roll.png"), scale=2.5)
+        (self.idle_frames, self.walk_frames, self.turn_frames,
+         self.spin_frames, self.roll_frames) = [self.load_frames(path, scale=FRAME_SCALE) for path in SHEET_PATHS]
         self.current_frame = 0
         self.frame_timer = 0
         self.frame_duration = 0.1
         self.last_frames = self.idle_frames
 
     def init_sprite(self):
-        # Initialize penguin sprites for snake-like following, each with its own animation state
+        # Initialize penguin sprites for snake-like following; their animation state lives in penguin_anims
+        clips = {IDLE: self.idle_frames, WALK: self.walk_frames, SPIN: self.spin_frames, ROLL: self.roll_frames}
+        self.penguin_anims = PenguinAnimations(clips, self.frame_duration)
         self.penguin_sprites = []
         head_sprite = self.create_penguin_sprite(self.player_x, self.player_y)
-        self.penguin_sprites.append(head_sprite)
-        self.player_sprite = head_sprite  # Keep for compatibility
+        self.player_sprite = head_sprite
         self.player_list = arcade.SpriteList()
-        self.player_list.append(head_sprite['sprite'])
-        # Store previous positions for snake movement
-        self.penguin_positions = [(self.player_x, self.player_y)]
+        self.player_list.append(head_sprite)
+        # Store previous positions for snake movement, newest first
+        self.penguin_positions = Trail()
+        self.penguin_positions.push(self.player_x, self.player_y)
 
     def create_penguin_sprite(self, x, y):
-        # Each penguin is a dict with its own animation state
         sprite = arcade.Sprite()
-        sprite.texture = self.idle_frames[0]
         sprite.center_x = x
         sprite.center_y = y
-        return {
-            'sprite': sprite,
-            'current_frame': 0,
-            'frame_timer': 0,
-            'current_animation': 'idle',
-            'facing_right': False,
-            'last_frames': self.idle_frames
-        }
+        self.penguin_sprites.append(sprite)
+        self.penguin_anims.add(sprite)
+        return sprite
 
     def init_fish(self):
-        self.fish_list = arcade.SpriteList()
-        self.spawn_fish()
+        # The fish are a fixed pool: built once, then only repositioned on each run and when collected.
+        # The spatial hash lets the spin attack test only the fish in the cells the head overlaps.
+        if getattr(self, 'fish_list', None) is None:
+            self.fish_list = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=FISH_CELL_SIZE)
+            for _ in range(self.fish_pool_size):
+                self.spawn_fish()
+        else:
+            for fish in self.fish_list:
+                self.reposition_fish(fish)
 
     def spawn_fish(self):
         window = self.window or arcade.get_window()
         if not window:
             return
-        fish_texture = arcade.load_texture(os.path.join(os.path.dirname(__file__), "Spritesheets", "fish.png"))
-        fish_sprite = arcade.Sprite()
-        fish_sprite.texture = fish_texture
+        # Every fish shares the one cached texture
+        fish_texture = assets.load_texture(FISH_PATH)
+        fish_sprite = arcade.Sprite(fish_texture)
         # Scale down the fish (e.g., 0.1x original size)
-        fish_sprite.width = int(fish_texture.width * 0.1)
-        fish_sprite.height = int(fish_texture.height * 0.1)
+        fish_sprite.width = int(fish_texture.width * FISH_SCALE)
+        fish_sprite.height = int(fish_texture.height * FISH_SCALE)
         # Spawn within borders (avoid black bars)
-        border = 40
-        x = random.randint(border, window.width - border)
-        y = random.randint(border, window.height - border)
-        fish_sprite.center_x = x
-        fish_sprite.center_y = y
+        self.reposition_fish(fish_sprite)
         self.fish_list.append(fish_sprite)
 
     # --- Return to Menu ---
@@ -117,7 +140,7 @@ class AntarticaGame(IGame, arcade.View):
 
     # --- Public API ---
     def get_name(self):
-        return self.title
+        return self.NAME
 
     def run(self, window):
         # Store window reference and setup initial state relative to window size
@@ -132,11 +155,10 @@ class AntarticaGame(IGame, arcade.View):
         self.fish_count = 0
         self.score = 0
         self.game_over = False
-        self.penguin_sprites = [] # Clear previous penguins
-        self.player_list = arcade.SpriteList() # Clear previous list
-        self.fish_list = arcade.SpriteList() # Clear previous fish
-        self.init_sprite() # Recreate head sprite
-        self.init_fish() # Spawn initial fish
+        self.init_sprite() # Recreate head sprite, dropping previous penguins
+        self.init_fish() # Scatter the fish pool again
+        for _ in range(self.conga_length):
+            self.add_penguin_follower()
         # Show the view
         window.show_view(self)
         # Do not return score here for View-based games
@@ -144,40 +166,14 @@ class AntarticaGame(IGame, arcade.View):
     def on_draw(self):
         self.clear()
         arcade.set_background_color(arcade.color.SKY_BLUE)
-        # Draw black borders
+        # Draw black borders (uploaded once, only re-laid out if the window size changes)
         border_thickness = 40
-        # Top
-        arcade.draw_lrbt_rectangle_filled(
-            left=0,
-            right=self.window.width,
-            top=self.window.height,
-            bottom=self.window.height - border_thickness,
-            color=arcade.color.BLACK,
-        )
-        # Bottom
-        arcade.draw_lrbt_rectangle_filled(
-            left=0,
-            right=self.window.width,
-            top=border_thickness,
-            bottom=0,
-            color=arcade.color.BLACK,
-        )
-        # Left
-        arcade.draw_lrbt_rectangle_filled(
-            left=0,
-            right=border_thickness,
-            top=self.window.height,
-            bottom=0,
-            color=arcade.color.BLACK,
-        )
-        # Right
-        arcade.draw_lrbt_rectangle_filled(
-            left=self.window.width - border_thickness,
-            right=self.window.width,
-            top=self.window.height,
-            bottom=0,
-            color=arcade.color.BLACK,
-        )
+        width, height = self.window.width, self.window.height
+        self.border_shapes.set_lrbt("top", 0, width, height - border_thickness, height, arcade.color.BLACK)
+        self.border_shapes.set_lrbt("bottom", 0, width, 0, border_thickness, arcade.color.BLACK)
+        self.border_shapes.set_lrbt("left", 0, border_thickness, 0, height, arcade.color.BLACK)
+        self.border_shapes.set_lrbt("right", width - border_thickness, width, 0, height, arcade.color.BLACK)
+        self.border_shapes.draw()
 
         self.fish_list.draw()
         self.player_list.draw()  # Draw all penguins at once, in order
@@ -194,45 +190,17 @@ class AntarticaGame(IGame, arcade.View):
         self.score_text.position = (self.window.width // 2, self.window.height - 30)
         self.score_text.draw()
         # Draw controls info at the bottom center
-        controls_text = arcade.Text(
-            "Space: Spin Attack    Right Shift: Roll",
-            self.window.width // 2,
-            50,
-            arcade.color.WHITE,
-            20,
-            anchor_x="center"
-        )
-        controls_text.draw()
-        if self.fish_count >= 15:
-            win_text = arcade.Text(
-                "You Win!",
-                self.window.width // 2,
-                self.window.height // 2,
-                arcade.color.GREEN,
-                48,
-                anchor_x="center"
-            )
-            win_text.draw()
+        self.hud.draw("controls", "Space: Spin Attack    Right Shift: Roll",
+                      self.window.width // 2, 50, arcade.color.WHITE, 20, anchor_x="center")
+        if self.fish_count >= self.fish_goal:
+            self.hud.draw("win", "You Win!", self.window.width // 2, self.window.height // 2,
+                          arcade.color.GREEN, 48, anchor_x="center")
         elif self.game_over:
-            game_over_text = arcade.Text(
-                "Game Over",
-                self.window.width // 2,
-                self.window.height // 2,
-                arcade.color.RED,
-                48,
-                anchor_x="center"
-            )
-            game_over_text.draw()
-            # Add message to return to menu
-            return_text = arcade.Text(
-                "Press SPACE to return to menu",
-                self.window.width // 2,
-                self.window.height // 2 - 50, # Below game over/win text
-                arcade.color.WHITE,
-                20,
-                anchor_x="center"
-            )
-            return_text.draw()
+            self.hud.draw("game_over", "Game Over", self.window.width // 2, self.window.height // 2,
+                          arcade.color.RED, 48, anchor_x="center")
+            # Add message to return to menu, below game over/win text
+            self.hud.draw("return", "Press SPACE to return to menu", self.window.width // 2, self.window.height // 2 - 50,
+                          arcade.color.WHITE, 20, anchor_x="center")
 
 
     def on_key_press(self, key, modifiers):
@@ -242,7 +210,7 @@ class AntarticaGame(IGame, arcade.View):
         self.handle_key_release(key)
 
     def on_update(self, delta_time):
-        if self.game_over or self.fish_count >= 15:
+        if self.game_over or self.fish_count >= self.fish_goal:
             return
         self.timer -= delta_time
         if self.timer <= 0:
@@ -256,7 +224,7 @@ class AntarticaGame(IGame, arcade.View):
         self.update_penguin_animations(delta_time)
         # Fish collection logic during Spin Attack
         if self.current_animation == 'spin':
-            hit_list = arcade.check_for_collision_with_list(self.player_sprite['sprite'], self.fish_list)
+            hit_list = arcade.check_for_collision_with_list(self.player_sprite, self.fish_list)
             if hit_list:
                 self.fish_count += len(hit_list)
                 for fish in hit_list:
@@ -266,7 +234,7 @@ class AntarticaGame(IGame, arcade.View):
         new_score = min(self.fish_count // 3, 5)
         if new_score != self.score:
             self.score = new_score
-        if self.fish_count >= 15:
+        if self.fish_count >= self.fish_goal:
             self.game_over = True
             # Don't return here, let on_draw show the win message and wait for SPACE
 
@@ -277,11 +245,10 @@ class AntarticaGame(IGame, arcade.View):
         border = 40
         x = random.randint(border, window.width - border)
         y = random.randint(border, window.height - border)
-        fish_sprite.center_x = x
-        fish_sprite.center_y = y
+        fish_sprite.position = (x, y)
 
     def get_color(self):
-        return (0, 255, 255)
+        return self.COLOR
 
     # --- Input Handling ---
     def handle_key_press(self, key):
@@ -325,8 +292,8 @@ class AntarticaGame(IGame, arcade.View):
             move_speed = int(base_speed * 2.5)
         moving = False
         window = self.window or arcade.get_window()
-        sprite_half_width = self.player_sprite['sprite'].texture.width // 2
-        sprite_half_height = self.player_sprite['sprite'].texture.height // 2
+        sprite_half_width = self.player_sprite.texture.width // 2
+        sprite_half_height = self.player_sprite.texture.height // 2
 
         # Move and clamp Y
         if arcade.key.UP in self.held_keys:
@@ -386,7 +353,7 @@ class AntarticaGame(IGame, arcade.View):
             self.current_animation = 'idle'
 
     # --- Animation Logic ---
-    def play_animation(self, frames, delta_time, loop=True, on_end=None, scale_x=None):
+    def play_animation(self, frames, delta_time, loop=True, on_end=None):
         if self.last_frames is not frames:
             self.current_frame = 0
             self.last_frames = frames
@@ -401,10 +368,7 @@ class AntarticaGame(IGame, arcade.View):
                 if on_end:
                     on_end()
                 return
-        self.player_sprite['sprite'].texture = frames[self.current_frame]
-        self.player_sprite['sprite'].scale_y = 1
-        if scale_x is not None:
-            self.player_sprite['sprite'].scale_x = scale_x
+        # The head's texture and facing are written by the batched step in update_penguin_animations
 
     def update_turn_animation(self, delta_time):
         def end_turn():
@@ -414,137 +378,129 @@ class AntarticaGame(IGame, arcade.View):
                 self.current_animation = 'walk'
             else:
                 self.current_animation = 'idle'
-        scale_x = -1 if self.turn_direction else 1
-        self.play_animation(self.turn_frames, delta_time, loop=False, on_end=end_turn, scale_x=scale_x)
+        self.play_animation(self.turn_frames, delta_time, loop=False, on_end=end_turn)
 
     def update_animation(self, delta_time):
         # Only update the head's animation state, not the texture
+        frame, timer = self.penguin_anims.frame, self.penguin_anims.timer
         if self.current_animation == 'spin':
             def end_spin():
                 self.current_animation = 'idle'
             # Advance frame for spin, but don't set texture here
-            self.player_sprite['frame_timer'] += delta_time * 2
-            if self.player_sprite['frame_timer'] >= self.frame_duration:
-                self.player_sprite['current_frame'] += 1
-                self.player_sprite['frame_timer'] = 0
-            if self.player_sprite['current_frame'] >= len(self.spin_frames):
+            timer[HEAD] += delta_time * 2
+            if timer[HEAD] >= self.frame_duration:
+                frame[HEAD] += 1
+                timer[HEAD] = 0
+            if frame[HEAD] >= len(self.spin_frames):
                 end_spin()
-                self.player_sprite['current_frame'] = 0
+                frame[HEAD] = 0
         elif self.current_animation == 'roll':
             def end_roll():
                 self.current_animation = 'idle'
-            self.player_sprite['frame_timer'] += delta_time
-            if self.player_sprite['frame_timer'] >= self.frame_duration:
-                self.player_sprite['current_frame'] += 1
-                self.player_sprite['frame_timer'] = 0
-            if self.player_sprite['current_frame'] >= len(self.roll_frames):
+            timer[HEAD] += delta_time
+            if timer[HEAD] >= self.frame_duration:
+                frame[HEAD] += 1
+                timer[HEAD] = 0
+            if frame[HEAD] >= len(self.roll_frames):
                 end_roll()
-                self.player_sprite['current_frame'] = 0
+                frame[HEAD] = 0
         elif self.turning or getattr(self, 'current_animation', None) == 'turn':
             self.update_turn_animation(delta_time)
         elif getattr(self, 'current_animation', None) == 'walk':
-            self.player_sprite['frame_timer'] += delta_time
-            if self.player_sprite['frame_timer'] >= self.frame_duration:
-                self.player_sprite['current_frame'] = (self.player_sprite['current_frame'] + 1) % len(self.walk_frames)
-                self.player_sprite['frame_timer'] = 0
+            timer[HEAD] += delta_time
+            if timer[HEAD] >= self.frame_duration:
+                frame[HEAD] = (frame[HEAD] + 1) % len(self.walk_frames)
+                timer[HEAD] = 0
         elif getattr(self, 'current_animation', None) == 'idle':
-            self.player_sprite['frame_timer'] += delta_time
-            if self.player_sprite['frame_timer'] >= self.frame_duration:
-                self.player_sprite['current_frame'] = (self.player_sprite['current_frame'] + 1) % len(self.idle_frames)
-                self.player_sprite['frame_timer'] = 0
+            timer[HEAD] += delta_time
+            if timer[HEAD] >= self.frame_duration:
+                frame[HEAD] = (frame[HEAD] + 1) % len(self.idle_frames)
+                timer[HEAD] = 0
         else:
             self.current_animation = 'idle'
-            self.player_sprite['frame_timer'] += delta_time
-            if self.player_sprite['frame_timer'] >= self.frame_duration:
-                self.player_sprite['current_frame'] = (self.player_sprite['current_frame'] + 1) % len(self.idle_frames)
-                self.player_sprite['frame_timer'] = 0
+            timer[HEAD] += delta_time
+            if timer[HEAD] >= self.frame_duration:
+                frame[HEAD] = (frame[HEAD] + 1) % len(self.idle_frames)
+                timer[HEAD] = 0
 
     def update_penguin_animations(self, delta_time):
-        # Head copies the main animation state, followers always walk or idle
-        for i, penguin in enumerate(self.penguin_sprites):
-            if i == 0:
-                # Head: use the main animation state (including spin/roll)
-                anim = self.current_animation
-                facing = self.facing_right
-            else:
-                # Followers: walk if moving, else idle, and face the same as head
-                anim = 'walk' if self.is_moving else 'idle'
-                facing = self.facing_right
-            self.animate_penguin(penguin, anim, facing, delta_time)
-
-    def animate_penguin(self, penguin, anim, facing_right, delta_time):
-        # Choose frames for all animation types
-        if anim == 'walk':
-            frames = self.walk_frames
-        elif anim == 'idle':
-            frames = self.idle_frames
-        elif anim == 'spin':
-            frames = self.spin_frames
-        elif anim == 'roll':
-            frames = self.roll_frames
-        else:
-            frames = self.idle_frames
-        # Animation logic
-        if penguin['last_frames'] is not frames:
-            penguin['current_frame'] = 0
-            penguin['last_frames'] = frames
-        penguin['frame_timer'] += delta_time
-        # Make spin animation faster
-        frame_duration = self.frame_duration
-        if anim == 'spin':
-            frame_duration /= 2
-        if penguin['frame_timer'] >= frame_duration:
-            penguin['current_frame'] = (penguin['current_frame'] + 1) % len(frames)
-            penguin['frame_timer'] = 0
-        penguin['sprite'].texture = frames[penguin['current_frame']]
-        penguin['sprite'].scale_y = 1
-        penguin['sprite'].scale_x = -1 if facing_right else 1
+        # Head plays the main animation state (including spin/roll); followers walk if moving,
+        # else idle, and all face the same as the head
+        follower_animation = 'walk' if self.is_moving else 'idle'
+        self.penguin_anims.step(self.current_animation, follower_animation, self.facing_right, delta_time)
 
     # --- Sprite Position Sync ---
     def sync_sprite_position(self):
         # Sync head position
-        self.player_sprite['sprite'].center_x = self.player_x
-        self.player_sprite['sprite'].center_y = self.player_y
+        self.player_sprite.position = (self.player_x, self.player_y)
 
+    @profiler.trace("update_penguin_followers")
     def update_penguin_followers(self):
-        # Always append the head's position, even if not moving
-        head_pos = (self.player_sprite['sprite'].center_x, self.player_sprite['sprite'].center_y)
-        self.penguin_positions.insert(0, head_pos)
-        min_distance = 10  # Adjust for more/less separation
+        trail = self.penguin_positions
+        # Limit the positions history to the number of penguins and their spacing;
+        # the buffer only grows when followers were added
+        max_history = len(self.penguin_sprites) * FOLLOWER_SPACING
+        trail.reserve(max_history)
+        # Always push the head's position, even if not moving
+        head = self.player_sprite
+        trail.push(head.center_x, head.center_y)
+        available = len(trail)
         # Each follower follows the one in front of it, using a delay
         for i in range(1, len(self.penguin_sprites)):
-            pos_index = i * min_distance
-            if pos_index < len(self.penguin_positions):
-                self.penguin_sprites[i]['sprite'].center_x, self.penguin_sprites[i]['sprite'].center_y = self.penguin_positions[pos_index]
-        # Limit the positions history to the number of penguins and min_distance
-        max_history = len(self.penguin_sprites) * min_distance
-        if len(self.penguin_positions) > max_history:
-            self.penguin_positions = self.penguin_positions[:max_history]
+            pos_index = i * FOLLOWER_SPACING
+            if pos_index < available:
+                self.penguin_sprites[i].position = trail.get(pos_index)
+        trail.truncate(max_history)
 
     def add_penguin_follower(self):
         # Add a new penguin at the last segment's position, with its own animation state
         if self.penguin_sprites:
-            last_sprite = self.penguin_sprites[-1]['sprite']
+            last_sprite = self.penguin_sprites[-1]
             new_penguin = self.create_penguin_sprite(last_sprite.center_x, last_sprite.center_y)
-            self.penguin_sprites.append(new_penguin)
-            self.player_list.append(new_penguin['sprite'])
-            if self.penguin_positions:
-                self.penguin_positions.append((last_sprite.center_x, last_sprite.center_y))
+            self.player_list.append(new_penguin)
+            if len(self.penguin_positions):
+                self.penguin_positions.reserve(len(self.penguin_positions) + 1)
+                self.penguin_positions.append_oldest(last_sprite.center_x, last_sprite.center_y)
 
     # --- Frame Loading Helper ---
     def load_frames(self, path, scale=1.0):
-        pil_image = PIL.Image.open(path).convert("RGBA")
-        width, height = pil_image.size
-        frame_count = width // height
-        frame_width = width // frame_count
-        frames = []
-        for i in range(frame_count):
-            box = (i * frame_width, 0, (i + 1) * frame_width, height)
-            frame_img = pil_image.crop(box)
-            if scale != 1.0:
-                new_size = (int(frame_img.width * scale), int(frame_img.height * scale))
-                frame_img = frame_img.resize(new_size, PIL.Image.Resampling.LANCZOS)
-            texture = arcade.Texture.create_empty(f"{os.path.basename(path)}_frame_{i}", frame_img.size)
-            texture.image = frame_img
-            frames.append(texture)
-        return frames
\ No newline at end of file
+        # Frames are shared through the asset cache, so rebuilding the game never re-slices
+        return assets.get_textures(frames_key(path, scale), lambda: slice_frames(path, scale))
+
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode and upscale every spritesheet frame on the asset prefetch workers."""
+        for path in SHEET_PATHS:
+            assets.prefetch(frames_key(path, FRAME_SCALE), lambda path=path: slice_frames(path, FRAME_SCALE))
+        assets.prefetch_file(FISH_PATH)
+
+
+def frames_key(path, scale):
+    return f"{path}:frames:x{scale}"
+
+
+def slice_frames(path, scale=1.0):
+    """Cut a horizontal strip of square frames into PIL images, optionally rescaled.
+
+    Frames come from the on-disk frame cache when possible, in which case the
+    sheet is never decoded or resampled.
+    """
+    with PIL.Image.open(path) as sheet:
+        # Only the header is read here
+        width, height = sheet.size
+    frame_count = width // height
+    frame_width = width // frame_count
+    new_size = (int(frame_width * scale), int(height * scale))
+    frames = []
+    for i in range(frame_count):
+        box = (i * frame_width, 0, (i + 1) * frame_width, height)
+        key = frame_cache.key(path, crop=box, scale=scale, resample=PIL.Image.Resampling.LANCZOS, size=new_size)
+        frames.append(frame_cache.get_or_create(key, lambda box=box: cut_frame(path, box, scale, new_size)))
+    return frames
+
+
+def cut_frame(path, box, scale, new_size):
+    frame_img = assets.load_image(path).crop(box)
+    if scale != 1.0:
+        frame_img = frame_img.resize(new_size, PIL.Image.Resampling.LANCZOS)
+    return frame_img
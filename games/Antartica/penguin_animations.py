@@ -0,0 +1,114 @@
+from array import array
+
+IDLE, WALK, SPIN, ROLL = range(4)
+# Any other animation name (e.g. "turn") shows the idle frames
+ANIMATION_IDS = {"idle": IDLE, "walk": WALK, "spin": SPIN, "roll": ROLL}
+HEAD = 0
+SHOWN_STRIDE = 1024
+
+
+class PenguinAnimations:
+    """Animation state of every penguin, as parallel arrays advanced in one step.
+
+    Penguins with identical state (frame index, frame timer, animation id and
+    facing) stay identical forever, since every follower plays the same animation
+    with the same facing. They are therefore kept in groups, and ``frame``,
+    ``timer``, ``anim`` and ``facing`` hold one entry per group. ``step`` advances
+    each group once and only touches a sprite when its group's frame or facing
+    changed, so the per-frame work depends on the number of distinct animation
+    phases (a handful) rather than the number of followers.
+
+    The head (penguin 0) always has group 0 to itself, since it can spin and roll.
+    """
+
+    def __init__(self, clips, frame_duration: float):
+        self.clips = clips  # animation id -> list of frame textures
+        self.frame_duration = frame_duration
+        self.sprites = []
+        self.group_of = array("i")
+        self.frame = array("i")
+        self.timer = array("d")
+        self.anim = array("b")
+        self.facing = array("b")  # 1 when facing right
+        # Frame currently on the group's sprites, as anim id * SHOWN_STRIDE + frame index
+        self.shown = array("i")
+        self.members = []
+        self.free_groups = []
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def add(self, sprite) -> int:
+        """Add a penguin showing the first idle frame, facing left. Returns its index."""
+        if self.free_groups:
+            group = self.free_groups.pop()
+            self.frame[group] = 0
+            self.timer[group] = 0.0
+            self.anim[group] = IDLE
+            self.facing[group] = 0
+            self.shown[group] = IDLE * SHOWN_STRIDE
+        else:
+            group = len(self.members)
+            self.members.append([])
+            self.frame.append(0)
+            self.timer.append(0.0)
+            self.anim.append(IDLE)
+            self.facing.append(0)
+            self.shown.append(IDLE * SHOWN_STRIDE)
+        index = len(self.sprites)
+        self.sprites.append(sprite)
+        self.group_of.append(group)
+        self.members[group].append(index)
+        sprite.texture = self.clips[IDLE][0]
+        sprite.scale_x = 1
+        return index
+
+    def step(self, head_animation: str, follower_animation: str, facing_right: bool, delta_time: float):
+        frame, timer, anim, facing, shown = self.frame, self.timer, self.anim, self.facing, self.shown
+        facing_flag = 1 if facing_right else 0
+        sprites = self.sprites
+        phases = {}
+        for group, members in enumerate(self.members):
+            if not members:
+                continue
+            name = head_animation if group == HEAD else follower_animation
+            target = ANIMATION_IDS.get(name, IDLE)
+            frames = self.clips[target]
+            if anim[group] != target:
+                anim[group] = target
+                frame[group] = 0
+            timer[group] += delta_time
+            # Make spin animation faster
+            duration = self.frame_duration / 2 if target == SPIN else self.frame_duration
+            if timer[group] >= duration:
+                frame[group] = (frame[group] + 1) % len(frames)
+                timer[group] = 0
+            # The head's frame may also have been advanced by the game, so compare with what is shown
+            showing = target * SHOWN_STRIDE + frame[group]
+            if shown[group] != showing:
+                shown[group] = showing
+                texture = frames[frame[group]]
+                for index in members:
+                    sprites[index].texture = texture
+            if facing[group] != facing_flag:
+                facing[group] = facing_flag
+                scale_x = -1 if facing_right else 1
+                for index in members:
+                    sprites[index].scale_x = scale_x
+            if group != HEAD:
+                phase = (frame[group], timer[group])
+                into = phases.get(phase)
+                if into is None:
+                    phases[phase] = group
+                else:
+                    self._merge(group, into)
+
+    def _merge(self, group: int, into: int):
+        for index in self.members[group]:
+            self.group_of[index] = into
+        self.members[into].extend(self.members[group])
+        self.members[group] = []
+        self.free_groups.append(group)
+
+    def group_count(self) -> int:
+        return sum(1 for members in self.members if members)
@@ -0,0 +1,74 @@
+from array import array
+
+
+class Trail:
+    """Ring buffer of (x, y) positions, newest first, backed by two flat arrays.
+
+    Pushing a position and reading the one ``age`` frames back are O(1), and
+    nothing is shifted or copied per frame. The buffer only grows (doubling) when
+    ``reserve`` asks for more room than it has; once full, a push overwrites the
+    oldest position.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = max(1, capacity)
+        self.xs = array("d", bytes(8 * self.capacity))
+        self.ys = array("d", bytes(8 * self.capacity))
+        self.head = 0  # slot of the newest position
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def reserve(self, capacity: int):
+        """Make room for at least ``capacity`` positions, keeping their order."""
+        if capacity <= self.capacity:
+            return
+        new_capacity = self.capacity
+        while new_capacity < capacity:
+            new_capacity *= 2
+        xs = array("d", bytes(8 * new_capacity))
+        ys = array("d", bytes(8 * new_capacity))
+        # Unroll so the newest position lands in slot count - 1 and older ones below it
+        for age in range(self.count):
+            slot = (self.head - age) % self.capacity
+            xs[self.count - 1 - age] = self.xs[slot]
+            ys[self.count - 1 - age] = self.ys[slot]
+        self.xs, self.ys = xs, ys
+        self.capacity = new_capacity
+        self.head = self.count - 1 if self.count else 0
+
+    def push(self, x: float, y: float):
+        """Add the newest position."""
+        if self.count:
+            self.head = (self.head + 1) % self.capacity
+        self.xs[self.head] = x
+        self.ys[self.head] = y
+        if self.count < self.capacity:
+            self.count += 1
+
+    def append_oldest(self, x: float, y: float):
+        """Add a position behind the oldest one, if there is room."""
+        if self.count >= self.capacity:
+            return
+        if not self.count:
+            self.push(x, y)
+            return
+        slot = (self.head - self.count) % self.capacity
+        self.xs[slot] = x
+        self.ys[slot] = y
+        self.count += 1
+
+    def get(self, age: int):
+        """Position ``age`` pushes ago (0 is the newest)."""
+        slot = (self.head - age) % self.capacity
+        return self.xs[slot], self.ys[slot]
+
+    def truncate(self, length: int):
+        """Forget everything older than the newest ``length`` positions."""
+        if self.count > length:
+            self.count = max(0, length)
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
@@ -1,13 +1,28 @@
 import arcade
-from arcade.types import Color
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.hud import ShapeLayer, TextLayer
+from games.scheduler import Scheduler
+import random
 import time
 
 WIDTH = 800
 HEIGHT = 600
 TITLE = "Test Fenêtre Arcade"
+# Kangaroo moves and attacks per second (the old per-frame chances at 60 FPS)
+KANGAROO_ADVANCE_RATE = 18   # 30% per frame
+KANGAROO_RETREAT_RATE = 12   # 20% per frame
+KANGAROO_ATTACK_RATE = 1.2   # 2% per frame
+KANGAROO_SPEED = 20
+# Every image the game loads; prefetch_assets decodes the same ones
+IMAGE_PATHS = tuple(f"games/Autralia/assets/{name}" for name in
+                    ("sydney.png", "kangaroo_wait.png", "kangaroo_hit.png", "playeur_wait.png", "playeur_hit.png"))
+BACKGROUND_PATH, KANGAROO_WAIT_PATH, KANGAROO_HIT_PATH, PLAYEUR_WAIT_PATH, PLAYEUR_HIT_PATH = IMAGE_PATHS
 
 class AustralieGame(arcade.View, IGame):
+    NAME = "Australie Fight"
+    COLOR = (255, 125, 0)
+
     def __init__(self):
         super().__init__()
         self.counter = 10
@@ -22,10 +37,13 @@ class AustralieGame(arcade.View, IGame):
         self.game_over = False
         self.game_over_time = 0
         self.final_score = 0
+        self.hud = TextLayer()
+        self.hp_bar_shapes = ShapeLayer()
+        self.scheduler = Scheduler()
 
         # Load background sprite
         try:
-            self.background_sprite = arcade.Sprite("games/Autralia/assets/sydney.png")
+            self.background_sprite = arcade.Sprite(assets.load_texture(BACKGROUND_PATH))
             self.background_sprite.width = self.window.width
             self.background_sprite.height = self.window.height
             self.background_sprite.center_x = self.window.width / 2
@@ -36,11 +54,11 @@ class AustralieGame(arcade.View, IGame):
             print("Error: Background file not found.")
             self.background_list = None
 
-        self.kangaroo_wait = arcade.Sprite("games/Autralia/assets/kangaroo_wait.png", 0.5)
+        self.kangaroo_wait = arcade.Sprite(assets.load_texture(KANGAROO_WAIT_PATH), 0.5)
         self.kangaroo_wait.center_x = 200
         self.kangaroo_wait.center_y = 300
 
-        self.kangaroo_hit = arcade.Sprite("games/Autralia/assets/kangaroo_hit.png", 0.5)
+        self.kangaroo_hit = arcade.Sprite(assets.load_texture(KANGAROO_HIT_PATH), 0.5)
         self.kangaroo_hit.center_x = 200
         self.kangaroo_hit.center_y = 300
 
@@ -51,11 +69,11 @@ class AustralieGame(arcade.View, IGame):
         self.kangaroo_hit_list.append(self.kangaroo_hit)
 
         # Sprites du joueur (wait/hit)
-        self.playeur_wait = arcade.Sprite("games/Autralia/assets/playeur_wait.png", 0.6)
+        self.playeur_wait = arcade.Sprite(assets.load_texture(PLAYEUR_WAIT_PATH), 0.6)
         self.playeur_wait.center_x = self.window.width - 200
         self.playeur_wait.center_y = 240
 
-        self.playeur_hit = arcade.Sprite("games/Autralia/assets/playeur_hit.png", 0.6)
+        self.playeur_hit = arcade.Sprite(assets.load_texture(PLAYEUR_HIT_PATH), 0.6)
         self.playeur_hit.center_x = self.window.width - 200
         self.playeur_hit.center_y = 240
 
@@ -90,12 +108,17 @@ class AustralieGame(arcade.View, IGame):
             self.background_sprite.height = self.window.height
             self.background_sprite.center_x = self.window.width / 2
             self.background_sprite.center_y = self.window.height / 2
+        # Kangaroo AI, timed on the game clock rather than rolled every frame
+        self.scheduler.reset(random.getrandbits(32))
+        self.scheduler.poisson(KANGAROO_ADVANCE_RATE, self.kangaroo_advance)
+        self.scheduler.poisson(KANGAROO_RETREAT_RATE, self.kangaroo_retreat)
+        self.scheduler.poisson(KANGAROO_ATTACK_RATE, self.kangaroo_attack)
 
     def display_end_screen(self):
         # Affiche le résultat si un des deux est mort
         if self.player_hp <= 0:
-            arcade.draw_text("LOOSE", self.window.width // 2 - 100, self.window.height // 2, arcade.color.RED, 60)
-            arcade.draw_text("Press SPACE to return to menu", self.window.width // 2, self.window.height // 2 - 50, arcade.color.WHITE, 20, anchor_x="center")
+            self.hud.draw("loose", "LOOSE", self.window.width // 2 - 100, self.window.height // 2, arcade.color.RED, 60)
+            self.hud.draw("return", "Press SPACE to return to menu", self.window.width // 2, self.window.height // 2 - 50, arcade.color.WHITE, 20, anchor_x="center")
         elif self.kangaroo_hp <= 0:
             # Calcul des points selon la vie restante du joueur
             hp = self.player_hp
@@ -112,8 +135,8 @@ class AustralieGame(arcade.View, IGame):
             else:
                 points = 0
             self.final_score = points
-            arcade.draw_text(f"WIN  {points} point(s)", self.window.width // 2 - 180, self.window.height // 2, arcade.color.GREEN, 60)
-            arcade.draw_text("Press SPACE to return to menu", self.window.width // 2, self.window.height // 2 - 50, arcade.color.WHITE, 20, anchor_x="center")
+            self.hud.draw("win", f"WIN  {points} point(s)", self.window.width // 2 - 180, self.window.height // 2, arcade.color.GREEN, 60)
+            self.hud.draw("return", "Press SPACE to return to menu", self.window.width // 2, self.window.height // 2 - 50, arcade.color.WHITE, 20, anchor_x="center")
 
     def on_draw(self):
         self.clear()
@@ -127,16 +150,18 @@ class AustralieGame(arcade.View, IGame):
         y_bar = self.window.height - 100
         # Joueur (gauche)
         # Bordure noire
-        arcade.draw_lbwh_rectangle_filled(30 - border_thickness, y_bar - border_thickness, hp_bar_width + 2*border_thickness, hp_bar_height + 2*border_thickness, arcade.color.BLACK)
+        self.hp_bar_shapes.set_lbwh("player_border", 30 - border_thickness, y_bar - border_thickness, hp_bar_width + 2*border_thickness, hp_bar_height + 2*border_thickness, arcade.color.BLACK)
         # Barre verte
-        arcade.draw_lbwh_rectangle_filled(30, y_bar, hp_bar_width * (self.player_hp / 100), hp_bar_height, arcade.color.GREEN)
-        arcade.draw_text(f"{self.player_hp} HP", 40 + hp_bar_width, y_bar + 10, arcade.color.BLACK, 28)
+        self.hp_bar_shapes.set_lbwh("player_hp", 30, y_bar, hp_bar_width * (self.player_hp / 100), hp_bar_height, arcade.color.GREEN)
         # Kangourou (droite)
         # Bordure noire
-        arcade.draw_lbwh_rectangle_filled(self.window.width - 30 - hp_bar_width - border_thickness, y_bar - border_thickness, hp_bar_width + 2*border_thickness, hp_bar_height + 2*border_thickness, arcade.color.BLACK)
+        self.hp_bar_shapes.set_lbwh("kangaroo_border", self.window.width - 30 - hp_bar_width - border_thickness, y_bar - border_thickness, hp_bar_width + 2*border_thickness, hp_bar_height + 2*border_thickness, arcade.color.BLACK)
         # Barre rouge
-        arcade.draw_lbwh_rectangle_filled(self.window.width - 30 - hp_bar_width, y_bar, hp_bar_width * (self.kangaroo_hp / 100), hp_bar_height, arcade.color.RED)
-        arcade.draw_text(f"{self.kangaroo_hp} HP", self.window.width - 50 - hp_bar_width - 100, y_bar + 10, arcade.color.BLACK, 28)
+        self.hp_bar_shapes.set_lbwh("kangaroo_hp", self.window.width - 30 - hp_bar_width, y_bar, hp_bar_width * (self.kangaroo_hp / 100), hp_bar_height, arcade.color.RED)
+        # Both bars go out in one draw call, under their labels
+        self.hp_bar_shapes.draw()
+        self.hud.draw("player_hp", f"{self.player_hp} HP", 40 + hp_bar_width, y_bar + 10, arcade.color.BLACK, 28)
+        self.hud.draw("kangaroo_hp", f"{self.kangaroo_hp} HP", self.window.width - 50 - hp_bar_width - 100, y_bar + 10, arcade.color.BLACK, 28)
         # Affiche le sprite du joueur
         if self.punch_timer_playeur > 0:
             self.playeur_hit_list.draw()
@@ -181,36 +206,12 @@ class AustralieGame(arcade.View, IGame):
             return
 
         # Mouvement et attaque aléatoire du kangourou (zone de jeu limitée)
-        import random
+        self.scheduler.advance(delta_time)
         # Définir les zones de déplacement
         zone_kangaroo_min = int(self.window.width * 0.0)
         zone_kangaroo_max = int(self.window.width * 0.7)
         zone_player_min = int(self.window.width * 0.3)
         zone_player_max = int(self.window.width * 1.0)
-        # Mouvement : 30% avance, 20% recule, 50% rien (bouge moins)
-        move = random.random()
-        kangaroo_speed = 20
-        if move < 0.3:
-            # Avance vers le joueur
-            if self.kangaroo_wait.center_x + kangaroo_speed < min(self.playeur_wait.center_x - 100, zone_kangaroo_max):
-                self.kangaroo_wait.center_x += kangaroo_speed
-                self.kangaroo_hit.center_x += kangaroo_speed
-        elif move < 0.5:
-            # Recule
-            if self.kangaroo_wait.center_x - kangaroo_speed > zone_kangaroo_min:
-                self.kangaroo_wait.center_x -= kangaroo_speed
-                self.kangaroo_hit.center_x -= kangaroo_speed
-        # Attaque aléatoire (2% de chance par frame, frappe moins souvent)
-        if random.random() < 0.02 and self.punch_timer_kangaroo == 0:
-            self.punch_timer_kangaroo = 0.5
-            # Si à moins de 300px du joueur, inflige des dégâts
-            distance = abs(self.playeur_wait.center_x - self.kangaroo_wait.center_x)
-            if distance <= 300:
-                self.player_hp -= 10
-                self.stun_timer_playeur = 0.2  # Le joueur est stun 0.2s
-                # Recul du joueur de 50px vers la droite
-                self.playeur_wait.center_x += 50
-                self.playeur_hit.center_x += 50
 
         # Collision : le joueur ne peut pas dépasser le kangourou et vice versa
         if self.playeur_wait.center_x < self.kangaroo_wait.center_x + 100:
@@ -234,6 +235,32 @@ class AustralieGame(arcade.View, IGame):
             self.kangaroo_wait.center_x = zone_kangaroo_max
             self.kangaroo_hit.center_x = zone_kangaroo_max
 
+    def kangaroo_advance(self):
+        # Avance vers le joueur
+        if self.kangaroo_wait.center_x + KANGAROO_SPEED < min(self.playeur_wait.center_x - 100, int(self.window.width * 0.7)):
+            self.kangaroo_wait.center_x += KANGAROO_SPEED
+            self.kangaroo_hit.center_x += KANGAROO_SPEED
+
+    def kangaroo_retreat(self):
+        # Recule
+        if self.kangaroo_wait.center_x - KANGAROO_SPEED > 0:
+            self.kangaroo_wait.center_x -= KANGAROO_SPEED
+            self.kangaroo_hit.center_x -= KANGAROO_SPEED
+
+    def kangaroo_attack(self):
+        # Attaque aléatoire, seulement si le dernier coup est fini
+        if self.punch_timer_kangaroo != 0:
+            return
+        self.punch_timer_kangaroo = 0.5
+        # Si à moins de 300px du joueur, inflige des dégâts
+        distance = abs(self.playeur_wait.center_x - self.kangaroo_wait.center_x)
+        if distance <= 300:
+            self.player_hp -= 10
+            self.stun_timer_playeur = 0.2  # Le joueur est stun 0.2s
+            # Recul du joueur de 50px vers la droite
+            self.playeur_wait.center_x += 50
+            self.playeur_hit.center_x += 50
+
     def on_key_press(self, symbol, modifiers):
         if self.game_over:
             if symbol == arcade.key.SPACE and self.game_over_time > 0.5:
@@ -281,11 +308,17 @@ class AustralieGame(arcade.View, IGame):
             if self.window:
                 self.window.close()
 
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode Sydney and both fighters' wait and hit poses in the background."""
+        for path in IMAGE_PATHS:
+            assets.prefetch_file(path)
+
     def get_name(self):
-        return "Australie Fight"
+        return self.NAME
 
     def get_color(self):
-        return Color(255, 125, 0)
+        return self.COLOR
 
     def run(self, window=None):
         if window is None:
@@ -1,22 +1,28 @@
-
 import arcade
-from arcade.types import Color, Rect
+from arcade.types import Color
+from games.asset_manager import assets
 
 FLOOR   = 90
 EDGE    = 800
-
-def create_rect(x, y, width, height):
-    return Rect(x, x + width, y, y + height, width, height, x + (width / 2), y + (height / 2))
+ENNEMY_PATH = "games/IstanbulCat/assets/ennemy.png"
 
 class Ennemy:
-    def __init__(self, name: str, position: tuple = (EDGE, 0.0), size: tuple = (100.0, 100.0)):
+    def __init__(self, name: str, position: tuple = (EDGE, 0.0), size: tuple = (100.0, 100.0), texture=None):
         self.name = name
-        self.position = position
+        # Bottom-left corner, updated in place
+        self.position = [position[0], position[1]]
         self.size = size
         self.color = arcade.color.RED
-        self.texture = arcade.load_texture("games/IstanbulCat/assets/ennemy.png")
-        self.rect = create_rect(self.position[0], self.position[1], 100, 100)
+        self.texture = texture or assets.load_texture(ENNEMY_PATH)
+        self.sprite = arcade.Sprite(self.texture)
+        self.sprite.size = size
+        self.reset(position)
+
+    def reset(self, position: tuple):
+        """Put the dog back at position, keeping the loaded texture and sprite."""
+        self.move(position[0], position[1])
 
     def move(self, x: int, y: int):
-        self.position = (x, y)
-        self.rect = create_rect(self.position[0], self.position[1], 100, 100)
+        self.position[0] = x
+        self.position[1] = y
+        self.sprite.position = (x + self.size[0] / 2, y + self.size[1] / 2)
@@ -1,149 +1,174 @@
 import arcade
 
-from arcade.types import Color
 from games.IGame import IGame
-from games.IstanbulCat.player import Player, JUMP, RUN, FALL
-from games.IstanbulCat.ennemy import Ennemy
-from arcade.types import LBWH, LRBT, XYWH, Color, Point2List, Rect, RGBOrA255
-from random import randint
+from games.asset_manager import assets
+from games.profiler import profiler
+from games.IstanbulCat.player import Player, JUMP, RUN, FALL, PLAYER_PATH
+from games.IstanbulCat.ennemy import Ennemy, ENNEMY_PATH
+from games.IstanbulCat.obstacle_stream import ObstacleStream
+from random import randint, getrandbits
 
 FLOOR           = 90
 BG_SPEED        = -1
-
-def create_rect(x, y, width, height):
-    return Rect(x, width, height, y, width, height, width / 2, height / 2)
+# The simulation runs at this fixed rate, whatever the display's frame rate
+TICK            = 1 / 60
+DOG_SPEED       = -6
+BACKGROUND_PATH = "games/IstanbulCat/assets/istanbul_background.png"
+# Every image the game and its cat and dogs load; prefetch_assets decodes the same ones
+IMAGE_PATHS     = (BACKGROUND_PATH, PLAYER_PATH, ENNEMY_PATH)
 
 class IstanbulCat(IGame, arcade.View):
+    NAME = "Istanbul Cat"
+    COLOR = (254, 0, 0)
 
-    def __init__(self):
+    def __init__(self, endless=False, seed=None):
         super().__init__()
+        self.endless = endless
+        self.seed = seed
         self.player = Player("WIWIWI", (200, FLOOR))
         self.player_pos_jump = FLOOR
-        self.background_texture = arcade.load_texture("games/IstanbulCat/assets/istanbul_background.png")
+        self.background_texture = assets.load_texture(BACKGROUND_PATH)
         self.window_width = self.window.width
         self.window_height = self.window.height
-        self.background_rect = create_rect(0, 0, self.window_width, self.window_height)
-        self.background_rect2 = Rect(
-            self.window_width,
-            self.window_width * 2,
-            self.window_height,
-            0,
-            self.window_width,
-            self.window_height,
-            self.window_width + self.window_width / 2,
-            self.window_height / 2
-        )
-        self.ennemy = []
+        # Two copies of the background side by side, scrolled by moving the sprites
+        self.background_list = arcade.SpriteList()
+        for i in range(2):
+            background = arcade.Sprite(self.background_texture)
+            background.size = (self.window_width, self.window_height)
+            self.background_list.append(background)
+        self.ennemy_texture = assets.load_texture(ENNEMY_PATH)
+        self.obstacles = None
+        if self.endless:
+            # The endless runner streams its dogs; the stream's deque stays sorted by x
+            self.obstacles = ObstacleStream(self.ennemy_texture, self.window_width)
+            self.ennemy = self.obstacles.active
+            self.ennemy_list = self.obstacles.sprite_list
+        else:
+            self.ennemy = [Ennemy("WIWIWI", texture=self.ennemy_texture) for _ in range(0, 5)]
+            self.ennemy_list = arcade.SpriteList()
+            for dog in self.ennemy:
+                self.ennemy_list.append(dog.sprite)
+        self.reset()
+
+    def reset(self):
+        """Start a new run in place, reusing the loaded textures and sprites."""
+        self.player.reset((200, FLOOR))
+        for i, background in enumerate(self.background_list):
+            background.position = (self.window_width * i + self.window_width / 2, self.window_height / 2)
         self.is_ended = False
         self.score = 0
-        for i in range(0, 5):
-            self.ennemy.append(Ennemy("WIWIWI", (self.window_width + (i * randint(600, 900)), FLOOR)))
+        self.tick_accumulator = 0.0
+        if self.obstacles:
+            self.obstacles.reset(self.seed if self.seed is not None else getrandbits(32))
+        else:
+            for i, dog in enumerate(self.ennemy):
+                dog.reset((self.window_width + (i * randint(600, 900)), FLOOR))
+            # Every dog runs at the same speed, so sorting once keeps them in x order for the run
+            self.ennemy.sort(key=lambda dog: dog.position[0])
 
     def run(self, window):
         if self.check_end():
-            self = self.__init__
+            self.reset()
             return 5
         window.show_view(self)
 
 
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode the Istanbul skyline, the cat and the dog in the background."""
+        for path in IMAGE_PATHS:
+            assets.prefetch_file(path)
+
     def get_name(self):
-        return "Istanbul Cat"
+        return self.NAME
 
     def get_color(self):
-        return Color(254, 0, 0)
+        return self.COLOR
 
     def on_draw(self):
         self.clear()
         self.draw_moving_background()
-        self.update_player()
         self.draw_player()
-        self.update_ennemy()
         self.draw_ennemy()
+
+    def on_update(self, delta_time):
+        self.tick_accumulator += delta_time
+        while self.tick_accumulator >= TICK:
+            self.tick_accumulator -= TICK
+            self.step()
+            if self.player.is_dead or self.is_ended:
+                self.reset()
+                self._return_to_menu()
+                return
+
+    def step(self):
+        """Advance the game by one fixed tick."""
+        self.update_background()
+        self.update_player()
+        self.update_ennemy()
         self.check_collision()
         self.check_end()
-        if self.player.is_dead or self.is_ended:
-            self.__init__()
-            self._return_to_menu()
 
     def on_key_press(self, key, modifiers):
         if key == arcade.key.SPACE and self.player.state == RUN:
             self.player.state = JUMP
         if key == arcade.key.ESCAPE:
-            self.__init__()
+            self.reset()
             self._return_to_menu()
 
+    def update_background(self):
+        for background in self.background_list:
+            background.center_x += BG_SPEED
+            # Once fully off the left edge, wrap around to just right of the screen
+            if background.center_x + self.window_width / 2 <= 0:
+                background.center_x = self.window_width + self.window_width / 2
+
     def draw_moving_background(self):
-        self.background_rect = self.background_rect.move(BG_SPEED, 0)
-        self.background_rect2 = self.background_rect2.move(BG_SPEED, 0)
-
-        if self.background_rect.right <= 0:
-            self.background_rect = Rect(
-            self.window_width,
-            self.window_width * 2,
-            self.window_height,
-            0,
-            self.window_width,
-            self.window_height,
-            self.window_width + self.window_width / 2,
-            self.window_height / 2
-        )
-
-        if self.background_rect2.right <= 0:
-            self.background_rect2 = Rect(
-            self.window_width,
-            self.window_width * 2,
-            self.window_height,
-            0,
-            self.window_width,
-            self.window_height,
-            self.window_width + self.window_width / 2,
-            self.window_height / 2
-        )
-
-        arcade.draw_texture_rect(self.background_texture, self.background_rect)
-        arcade.draw_texture_rect(self.background_texture, self.background_rect2)
+        self.background_list.draw()
 
     def update_player(self):
         if self.player.state == JUMP:
-            position = list(self.player.position)
-            position[1] += 4
-            self.player.move(position[0], position[1])
+            self.player.move(self.player.position[0], self.player.position[1] + 4)
             if self.player.position[1] >= FLOOR + 200:
                 self.player.state = FALL
         if self.player.state == FALL:
-            position = list(self.player.position)
-            position[1] -= 4
-            self.player.move(position[0], position[1])
+            self.player.move(self.player.position[0], self.player.position[1] - 4)
             if self.player.position[1] <= FLOOR:
                 self.player.state = RUN
 
     def draw_player(self):
-        arcade.draw_texture_rect(self.player.texture, self.player.rect)
+        arcade.draw_sprite(self.player.sprite)
 
     def draw_ennemy(self):
-        for dogs in self.ennemy:
-            arcade.draw_texture_rect(dogs.texture, dogs.rect)
+        self.ennemy_list.draw()
 
     def update_ennemy(self):
+        if self.obstacles:
+            self.obstacles.advance(DOG_SPEED)
+            return
         for dogs in self.ennemy:
-            position = list(dogs.position)
-            position[0] -= 6
-            dogs.move(position[0], position[1])
+            dogs.move(dogs.position[0] + DOG_SPEED, dogs.position[1])
 
+    @profiler.trace("check_collision")
     def check_collision(self):
+        # Dogs are sorted by x, so only those in the player's x-window get the full test
+        player_left = self.player.position[0]
+        player_right = player_left + self.player.size[0]
         for dog in self.ennemy:
+            if dog.position[0] + dog.size[0] <= player_left:
+                continue # Already behind the player
+            if dog.position[0] >= player_right:
+                break # This dog and every one after it are still ahead
             if (
-                self.player.position[0] < dog.position[0] + dog.size[0] and
-                self.player.position[0] + self.player.size[0] > dog.position[0] and
                 self.player.position[1] < dog.position[1] + dog.size[1] and
                 self.player.position[1] + self.player.size[1] > dog.position[1]
             ):
                 self.player.is_dead = True
 
     def check_end(self):
-        for dog in self.ennemy:
-            if dog.position[0] > 0:
-                return False
+        # The endless runner only ends when the cat is caught
+        if self.endless or (self.ennemy and self.ennemy[-1].position[0] > 0):
+            return False
         self.is_ended = True
         self.score = 5
         return True
@@ -0,0 +1,75 @@
+import random
+from collections import deque
+
+import arcade
+
+from games.IstanbulCat.ennemy import Ennemy
+
+FLOOR           = 90
+CHUNK_WIDTH     = 2400
+# A new chunk is generated once the ungenerated part of the track is this close to the screen
+LOOKAHEAD       = 600
+DOG_GAP         = (600, 900)
+
+
+class ObstacleStream:
+    """Endless dogs for the runner, generated chunk by chunk just ahead of the screen.
+
+    Dog spacing comes from the stream's own seeded generator, so a seed always
+    produces the same track. Dogs all run left at one speed, so ``active`` stays
+    sorted by x: dogs that passed the left edge are popped from its front and
+    kept in ``pool`` for the next chunk. Only the dogs on or near the screen
+    exist, however long the run goes.
+    """
+
+    def __init__(self, texture, screen_width: int, seed=None):
+        self.texture = texture
+        self.screen_width = screen_width
+        self.random = random.Random()
+        self.active = deque()
+        self.pool = []
+        self.sprite_list = arcade.SpriteList()
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a new track from seed, sending every dog on it back to the pool."""
+        while self.active:
+            dog = self.active.pop()
+            self.sprite_list.remove(dog.sprite)
+            self.pool.append(dog)
+        self.random.seed(seed)
+        self.next_x = self.screen_width  # where the next dog goes
+        self.generated_to = self.screen_width  # right edge of the last generated chunk
+        self.passed = 0
+        self.generate()
+
+    def generate(self):
+        """Add chunks until the track is generated past the lookahead."""
+        while self.generated_to < self.screen_width + LOOKAHEAD:
+            chunk_end = self.generated_to + CHUNK_WIDTH
+            while self.next_x < chunk_end:
+                self._place_dog(self.next_x)
+                self.next_x += self.random.randint(*DOG_GAP)
+            self.generated_to = chunk_end
+
+    def _place_dog(self, x):
+        if self.pool:
+            dog = self.pool.pop()
+            dog.reset((x, FLOOR))
+        else:
+            dog = Ennemy("WIWIWI", (x, FLOOR), texture=self.texture)
+        self.active.append(dog)
+        self.sprite_list.append(dog.sprite)
+
+    def advance(self, dx: float):
+        """Move the whole track by ``dx``, recycle the dogs behind the screen and extend the front."""
+        for dog in self.active:
+            dog.move(dog.position[0] + dx, dog.position[1])
+        self.next_x += dx
+        self.generated_to += dx
+        while self.active and self.active[0].position[0] + self.active[0].size[0] < 0:
+            dog = self.active.popleft()
+            self.sprite_list.remove(dog.sprite)
+            self.pool.append(dog)
+            self.passed += 1
+        self.generate()
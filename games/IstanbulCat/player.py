@@ -1,28 +1,35 @@
-
 import arcade
-from arcade.types import Color, Rect
+from arcade.types import Color
+from games.asset_manager import assets
 
 RUN     = 1
 JUMP    = 2
 FALL    = 3
 
 FLOOR = 90
-
-def create_rect(x, y, width, height):
-    return Rect(x, x + width, y, y + height, width, height, x + (width / 2), y + (height / 2))
+PLAYER_PATH = "games/IstanbulCat/assets/player.png"
 
 class Player:
     def __init__(self, name: str, position: tuple = (0.0, 0.0), size: tuple = (100.0, 100.0)):
         self.name = name
-        self.position = position
+        # Bottom-left corner, updated in place
+        self.position = [position[0], position[1]]
         self.size = size
         self.state = RUN
         self.color = arcade.color.BLUE
         self.is_dead = False
-        self.texture = arcade.load_texture("games/IstanbulCat/assets/player.png")
-        self.rect = create_rect(self.position[0], self.position[1], 100, 100)
+        self.texture = assets.load_texture(PLAYER_PATH)
+        self.sprite = arcade.Sprite(self.texture)
+        self.sprite.size = size
+        self.reset(position)
 
+    def reset(self, position: tuple):
+        """Back on the ground at position, alive, keeping the loaded texture and sprite."""
+        self.state = RUN
+        self.is_dead = False
+        self.move(position[0], position[1])
 
     def move(self, x: int, y: int):
-        self.position = (x, y)
-        self.rect = create_rect(self.position[0], self.position[1], 100, 100)
+        self.position[0] = x
+        self.position[1] = y
+        self.sprite.position = (x + self.size[0] / 2, y + self.size[1] / 2)
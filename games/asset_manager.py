@@ -0,0 +1,297 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import arcade
+from PIL import Image
+
+from games.profiler import profiler
+
+# Root of the repository, so asset paths never depend on the current working directory
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# PIL releases the GIL while decoding and resampling, so a couple of workers is enough
+PREFETCH_WORKERS = 2
+
+
+def resolve_path(path: str) -> str:
+    """Return an absolute, normalized path. Relative paths are taken from the project root."""
+    if not os.path.isabs(path):
+        path = os.path.join(PROJECT_ROOT, path)
+    return os.path.normpath(path)
+
+
+class AssetManager:
+    """Keyed cache of decoded images and textures shared by every minigame.
+
+    Each file is decoded from disk at most once. Derived assets (crops, resized
+    backgrounds, sliced frames) are cached under caller-chosen keys and can be
+    prepared ahead of time on a worker thread with ``prefetch``. When
+    ``max_bytes`` is set, least recently used entries are evicted once the
+    decoded RGBA size of the cache goes above it. All textures end up in the
+    window's default texture atlas, which every SpriteList and draw call shares.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.disk_loads = 0
+        self.texture_loads = 0  # load_texture calls, cached or not
+        self._entries: OrderedDict[str, Tuple[object, int]] = OrderedDict()
+        # Worker results waiting to be picked up on the main thread
+        self._pending: Dict[str, Future] = {}
+        self._executor = None
+        self._lock = threading.RLock()
+
+    # --- Cache bookkeeping ---
+    def _get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _put(self, key: str, value, nbytes: int):
+        with self._lock:
+            if key in self._entries:
+                self.bytes_used -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self.bytes_used += nbytes
+            self._evict()
+        return value
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        # Never evict the entry that was just added, even if it alone is over budget
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.bytes_used -= nbytes
+
+    def evict(self, key: str):
+        """Drop one entry. Textures leave the atlas once no sprite references them."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self.bytes_used -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+            self.bytes_used = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # --- Background prefetch ---
+    def prefetch(self, key: str, factory: Callable[[], Image.Image | List[Image.Image]]):
+        """Start building the texture(s) for key on a worker thread.
+
+        The factory must only do PIL work (decode, crop, resize). The worker also
+        computes the textures' hit boxes; nothing touches OpenGL. The next
+        ``get_texture``/``get_textures`` call for key picks up the result, waiting
+        for it if the worker hasn't finished, and the atlas upload happens on the
+        main thread.
+        """
+        self._submit(key, lambda: self._make_textures(factory(), key))
+
+    def prefetch_file(self, path: str):
+        """Decode an image file in the background for a later load_image/load_texture/texture_grid."""
+        path = resolve_path(path)
+        if f"texture:{path}" in self._entries:
+            return
+        self._submit(f"file:{path}", lambda: self._make_file_texture(path, self._decode(path)))
+
+    def _submit(self, key: str, job: Callable[[], object]):
+        with self._lock:
+            if key in self._entries or key in self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS,
+                                                    thread_name_prefix="asset-prefetch")
+            self._pending[key] = self._executor.submit(job)
+
+    def wait_for_prefetch(self):
+        """Block until every submitted prefetch job has finished. Results stay pending."""
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            future.exception()
+
+    def _take_prefetched(self, key: str):
+        with self._lock:
+            future = self._pending.pop(key, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Warning: prefetch of {key} failed: {e}")
+            return None
+
+    # --- Loading ---
+    def _decode(self, path: str) -> Image.Image:
+        with profiler.span(f"decode {os.path.basename(path)}"), Image.open(path) as source:
+            image = source.convert("RGBA")
+        with self._lock:
+            self.disk_loads += 1
+        return image
+
+    def _source_image(self, path: str) -> Image.Image:
+        """Decoded image for path from the prefetcher, the cache, or the disk, without caching it."""
+        texture = self._take_prefetched(f"file:{path}")
+        if texture is not None:
+            return texture.image
+        return self._get(f"image:{path}") or self._decode(path)
+
+    def load_image(self, path: str) -> Image.Image:
+        """Decode an image file to RGBA once. The returned image is shared and must not be modified."""
+        path = resolve_path(path)
+        key = f"image:{path}"
+        image = self._get(key)
+        if image is None:
+            image = self._source_image(path)
+            self._put(key, image, image.width * image.height * 4)
+        return image
+
+    def load_texture(self, path: str) -> arcade.Texture:
+        """Return the shared texture for an image file."""
+        path = resolve_path(path)
+        key = f"texture:{path}"
+        self.texture_loads += 1
+        texture = self._get(key)
+        if texture is None:
+            with profiler.span(f"load_texture {os.path.basename(path)}"):
+                texture = self._take_prefetched(f"file:{path}")
+                if texture is None:
+                    # Reuse an already decoded image, but don't keep a second cache entry for it
+                    texture = self._make_file_texture(path, self._source_image(path))
+            self._put(key, texture, texture.width * texture.height * 4)
+        return texture
+
+    def get_texture(self, key: str, factory: Callable[[], Image.Image]) -> arcade.Texture:
+        """Return the texture cached under key, building its image with factory on a miss."""
+        texture = self._get(key)
+        if texture is None:
+            with profiler.span("get_texture"):
+                texture = self._take_prefetched(key) or self._make_textures(factory(), key)
+            self._put(key, texture, texture.width * texture.height * 4)
+        return texture
+
+    def get_textures(self, key: str, factory: Callable[[], List[Image.Image]]) -> List[arcade.Texture]:
+        """Like get_texture, for a factory returning a list of images (e.g. animation frames)."""
+        textures = self._get(key)
+        if textures is None:
+            with profiler.span("get_textures"):
+                textures = self._take_prefetched(key) or self._make_textures(factory(), key)
+            self._put(key, textures, sum(texture.width * texture.height * 4 for texture in textures))
+        return textures
+
+    @staticmethod
+    def _make_textures(images: Image.Image | List[Image.Image], key: str):
+        """Wrap one image, or a list of images, into textures named after key."""
+        if isinstance(images, list):
+            return [AssetManager._make_textures(image, f"{key}:{i}") for i, image in enumerate(images)]
+        if images.mode != "RGBA":
+            images = images.convert("RGBA")
+        return arcade.Texture(images, hash=key)
+
+    @staticmethod
+    def _make_file_texture(path: str, image: Image.Image) -> arcade.Texture:
+        texture = arcade.Texture(image, hash=f"texture:{path}")
+        texture.file_path = path
+        return texture
+
+    def texture_grid(self, path: str, size: Tuple[int, int], columns: int, count: int) -> List[arcade.Texture]:
+        """Slice a spritesheet into a list of textures, left to right and top to bottom."""
+        path = resolve_path(path)
+        key = self._grid_key(path, size, columns, count)
+        textures = self._get(key)
+        if textures is None:
+            textures = self._take_prefetched(key) or self._slice_grid(self._source_image(path), size, columns, count)
+            self._put(key, textures, size[0] * size[1] * 4 * count)
+        return textures
+
+    def prefetch_grid(self, path: str, size: Tuple[int, int], columns: int, count: int):
+        """Decode and slice a spritesheet in the background for a later texture_grid call."""
+        path = resolve_path(path)
+        self._submit(self._grid_key(path, size, columns, count),
+                     lambda: self._slice_grid(self._decode(path), size, columns, count))
+
+    @staticmethod
+    def _grid_key(path, size, columns, count) -> str:
+        return f"grid:{path}:{size[0]}x{size[1]}:{columns}:{count}"
+
+    @staticmethod
+    def _slice_grid(image: Image.Image, size, columns, count) -> List[arcade.Texture]:
+        sheet = arcade.SpriteSheet.from_image(image)
+        return sheet.get_texture_grid(size=size, columns=columns, count=count)
+
+    def trimmed_grid(self, path: str, size: Tuple[int, int], rows: int, columns: int) -> List[arcade.Texture]:
+        """Slice the top-left rows x columns frames of a spritesheet, cropped of their transparent padding.
+
+        Every frame is cropped to the same box, centered on the frame, so trimmed frames keep
+        the anchor and hit box of the untrimmed ones and can be swapped for each other.
+        """
+        path = resolve_path(path)
+        key = self._trimmed_key(path, size, rows, columns)
+        textures = self._get(key)
+        if textures is None:
+            textures = self._take_prefetched(key) or self._make_textures(
+                self._trim_grid(self._source_image(path), size, rows, columns), key)
+            self._put(key, textures, sum(texture.width * texture.height * 4 for texture in textures))
+        return textures
+
+    def prefetch_trimmed_grid(self, path: str, size: Tuple[int, int], rows: int, columns: int):
+        """Decode, slice and trim a spritesheet in the background for a later trimmed_grid call."""
+        path = resolve_path(path)
+        self.prefetch(self._trimmed_key(path, size, rows, columns),
+                      lambda: self._trim_grid(self._decode(path), size, rows, columns))
+
+    @staticmethod
+    def _trimmed_key(path, size, rows, columns) -> str:
+        return f"trimmed:{path}:{size[0]}x{size[1]}:{rows}x{columns}"
+
+    @staticmethod
+    def _trim_grid(image: Image.Image, size, rows, columns) -> List[Image.Image]:
+        width, height = size
+        frames = [image.crop((column * width, row * height, (column + 1) * width, (row + 1) * height))
+                  for row in range(rows) for column in range(columns)]
+        # Smallest margins any frame leaves on either side, so the box stays centered
+        margin_x = margin_y = None
+        for frame in frames:
+            box = frame.getchannel("A").getbbox()
+            if box:
+                margin_x = min(box[0], width - box[2], width if margin_x is None else margin_x)
+                margin_y = min(box[1], height - box[3], height if margin_y is None else margin_y)
+        if margin_x is None:
+            return frames  # fully transparent, nothing to crop to
+        return [frame.crop((margin_x, margin_y, width - margin_x, height - margin_y)) for frame in frames]
+
+    # --- Atlas ---
+    def textures(self) -> List[arcade.Texture]:
+        """All cached textures, including the ones sliced from spritesheets."""
+        result = []
+        for value, _ in self._entries.values():
+            if isinstance(value, arcade.Texture):
+                result.append(value)
+            elif isinstance(value, list):
+                result.extend(value)
+        return result
+
+    def upload(self, atlas=None):
+        """Pack every cached texture into the shared atlas so view switches never upload."""
+        if atlas is None:
+            window = arcade.get_window()
+            atlas = window.ctx.default_atlas
+        with profiler.span("atlas upload"):
+            for texture in self.textures():
+                atlas.add(texture)
+
+
+# Shared instance used by the menu and every minigame
+assets = AssetManager()
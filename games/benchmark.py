@@ -0,0 +1,328 @@
+"""Per-game frame-time benchmark with regression thresholds.
+
+Each game plays a fixed scripted session with a seeded ``random`` in the
+headless harness, in its own process so peak RSS is per game. Run from the
+project root::
+
+    python -m games.benchmark --update-baseline     # record bench_baseline.json
+    python -m games.benchmark                       # compare, exit 1 on regression
+    python -m games.benchmark --games "Sushi Rampage" --threshold 0.5
+    python -m games.benchmark --stress                  # also run the stress modes
+"""
+import os
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import argparse
+import json
+import subprocess
+import sys
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import arcade
+
+from games.headless import HeadlessRunner, click, press, release, tap
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DEFAULT_THRESHOLD = 0.25
+SEED = 1234
+ALLOC_FRAMES = 300
+RESULT_PREFIX = "BENCHMARK_RESULT "
+
+# Metric -> smallest absolute increase that counts as a regression, to ignore timer noise
+REGRESSION_METRICS = {
+    "update_p95_ms": 0.05,
+    "update_p99_ms": 0.1,
+    "draw_p95_ms": 0.5,
+    "alloc_kb_per_frame": 1.0,
+    "peak_rss_mb": 5.0,
+}
+
+
+# --- Scripted sessions ---
+def europa_session():
+    script = []
+    for beer in range(5):
+        start = 0.5 + beer * 2.0
+        script += [press(start, arcade.key.SPACE), release(start + 0.6 + beer * 0.05, arcade.key.SPACE)]
+        script += tap(start + 1.5, arcade.key.SPACE)
+    return script, 12.0
+
+
+def japan_session():
+    return [event for i in range(80) for event in tap(0.5 + i * 0.25, arcade.key.SPACE)], 25.0
+
+
+def brazil_session():
+    script = []
+    for i in range(40):
+        key = arcade.key.LEFT if i % 2 else arcade.key.RIGHT
+        script += tap(0.5 * i, key) + tap(0.5 * i + 0.25, arcade.key.SPACE)
+    return script, 20.0
+
+
+def usa_session():
+    script = [click(1.0 + i * 1.1, 100 + (i * 173) % 1000, 250 + (i * 97) % 400) for i in range(10)]
+    return script + tap(13.0, arcade.key.SPACE), 14.0
+
+
+def antarctica_session():
+    script = []
+    directions = [arcade.key.RIGHT, arcade.key.UP, arcade.key.LEFT, arcade.key.DOWN]
+    for i in range(19):
+        key = directions[i % 4]
+        script += [press(i, key), release(i + 0.9, key)]
+        script += tap(i + 0.5, arcade.key.SPACE)
+    return script + tap(21.0, arcade.key.SPACE), 22.0
+
+
+def africa_session():
+    script = []
+    for i in range(15):
+        key = arcade.key.LEFT if i % 2 else arcade.key.RIGHT
+        script += [press(i * 2, key), release(i * 2 + 1.5, key)]
+    return script + tap(31.0, arcade.key.SPACE), 32.0
+
+
+def istanbul_session():
+    return [event for i in range(20) for event in tap(0.5 + i * 1.1, arcade.key.SPACE)], 25.0
+
+
+def australia_session():
+    script = []
+    for i in range(60):
+        script += tap(0.3 * i, arcade.key.SPACE if i % 3 else arcade.key.Q)
+    return script + tap(20.0, arcade.key.SPACE), 21.0
+
+
+# --- Stress modes: scaled-up variants of a game that never appear in the menu ---
+def long_conga():
+    from games.Antartica.antartica_game import AntarticaGame, LONG_CONGA_LENGTH
+    return AntarticaGame(conga_length=LONG_CONGA_LENGTH)
+
+
+def long_conga_session():
+    script, _ = antarctica_session()
+    return script, 10.0
+
+
+def fish_frenzy():
+    from games.Antartica.antartica_game import AntarticaGame, FRENZY_FISH
+    return AntarticaGame(fish_pool_size=FRENZY_FISH, fish_goal=float("inf"))
+
+
+def fruit_storm():
+    from games.Africa.africa_game import AfricaGame, STORM_FRUIT
+    return AfricaGame(storm_size=STORM_FRUIT, fruit_goal=float("inf"))
+
+
+def fruit_storm_session():
+    script, _ = africa_session()
+    return script, 10.0
+
+
+def duck_swarm():
+    from games.usa_game.usa_game import USAGame, SWARM_DUCKS
+    return USAGame(swarm_size=SWARM_DUCKS)
+
+
+def duck_swarm_session():
+    script, _ = usa_session()
+    return script, 10.0
+
+
+def endless_runner():
+    from games.IstanbulCat.istanbul_cat import IstanbulCat
+
+    class ImmortalCat(IstanbulCat):
+        """Collisions are still tested every tick, but never end the run."""
+
+        def check_collision(self):
+            super().check_collision()
+            self.player.is_dead = False
+
+    return ImmortalCat(endless=True)
+
+
+def endless_runner_session():
+    return [event for i in range(40) for event in tap(0.5 + i * 1.1, arcade.key.SPACE)], 45.0
+
+
+STRESS_MODES = {
+    "Antarctica long conga": (long_conga, long_conga_session),
+    "Antarctica fish frenzy": (fish_frenzy, long_conga_session),
+    "Africa fruit storm": (fruit_storm, fruit_storm_session),
+    "USA duck swarm": (duck_swarm, duck_swarm_session),
+    "Istanbul endless runner": (endless_runner, endless_runner_session),
+}
+
+
+SESSIONS = {
+    "Europa Bar Challenge": europa_session,
+    "Sushi Rampage": japan_session,
+    "Tha Brazil Game Thing": brazil_session,
+    "Duck Hunt USA": usa_session,
+    "Antarctica Adventure": antarctica_session,
+    "Africa Fruit Catcher": africa_session,
+    "Istanbul Cat": istanbul_session,
+    "Australie Fight": australia_session,
+}
+
+
+# --- Measurement ---
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return 0.0
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def measure_game(name, render=True):
+    """Run one game's session twice: once for timings, once under tracemalloc for allocations."""
+    if name in STRESS_MODES:
+        factory, session = STRESS_MODES[name]
+    else:
+        from main import create_registry
+        factory, session = create_registry().get(name).factory, SESSIONS[name]
+    script, seconds = session()
+    runner = HeadlessRunner(render=render)
+
+    timed = runner.run(factory, script, max_seconds=seconds, seed=SEED)
+    # Before tracemalloc starts, so its own bookkeeping isn't counted as the game's memory
+    rss_mb = peak_rss_mb()
+
+    alloc_bytes = []
+    alloc_blocks = []
+    last = {}
+    def sample(frame, view):
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        if last:
+            alloc_bytes.append(peak - last["current"])
+            alloc_blocks.append(blocks - last["blocks"])
+        last["current"] = current
+        last["blocks"] = blocks
+        tracemalloc.reset_peak()
+    tracemalloc.start()
+    runner.run(factory, script, max_seconds=min(seconds, ALLOC_FRAMES * runner.delta_time),
+               seed=SEED, on_frame=sample)
+    tracemalloc.stop()
+
+    to_ms = lambda samples, fraction: round(percentile(samples, fraction) * 1000, 4)
+    return {
+        "frames": timed.frames,
+        "finished": timed.finished,
+        "score": timed.score,
+        "update_p50_ms": to_ms(timed.update_times, 0.50),
+        "update_p95_ms": to_ms(timed.update_times, 0.95),
+        "update_p99_ms": to_ms(timed.update_times, 0.99),
+        "draw_p50_ms": to_ms(timed.draw_times, 0.50),
+        "draw_p95_ms": to_ms(timed.draw_times, 0.95),
+        "draw_p99_ms": to_ms(timed.draw_times, 0.99),
+        "alloc_kb_per_frame": round(sum(alloc_bytes) / max(1, len(alloc_bytes)) / 1024, 3),
+        "alloc_blocks_per_frame": round(sum(alloc_blocks) / max(1, len(alloc_blocks)), 3),
+        "peak_rss_mb": round(rss_mb, 1),
+    }
+
+
+def run_in_subprocess(name, render):
+    command = [sys.executable, "-m", "games.benchmark", "--worker", name]
+    if not render:
+        command.append("--no-render")
+    completed = subprocess.run(command, capture_output=True, text=True)
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"Benchmark worker for '{name}' failed:\n{completed.stderr[-2000:]}")
+
+
+def compare(results, baseline, threshold):
+    """Return a list of human-readable regressions against the baseline."""
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        for metric, min_increase in REGRESSION_METRICS.items():
+            if metric not in reference or metric not in metrics:
+                continue
+            old, new = reference[metric], metrics[metric]
+            if new > old * (1 + threshold) and new - old > min_increase:
+                regressions.append(f"{name}: {metric} {old} -> {new} (+{(new / old - 1) * 100 if old else float('inf'):.0f}%)")
+    return regressions
+
+
+def print_table(results):
+    columns = ["update_p50_ms", "update_p95_ms", "update_p99_ms", "draw_p50_ms", "draw_p95_ms",
+               "draw_p99_ms", "alloc_kb_per_frame", "alloc_blocks_per_frame", "peak_rss_mb"]
+    print(f"{'game':<24}" + "".join(f"{column:>24}" for column in columns))
+    for name, metrics in results.items():
+        print(f"{name:<24}" + "".join(f"{metrics[column]:>24}" for column in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-game frame-time benchmark")
+    parser.add_argument("--games", nargs="*", default=list(SESSIONS), help="games to run (default: all)")
+    parser.add_argument("--stress", action="store_true", help="also run the stress modes: " + ", ".join(STRESS_MODES))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative increase before a metric counts as a regression")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--no-render", action="store_true", help="only time on_update")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(RESULT_PREFIX + json.dumps(measure_game(args.worker, render=not args.no_render)))
+        return 0
+
+    names = list(args.games)
+    if args.stress:
+        names += [name for name in STRESS_MODES if name not in names]
+    results = {}
+    for name in names:
+        print(f"Benchmarking {name}...", flush=True)
+        results[name] = run_in_subprocess(name, render=not args.no_render)
+    print_table(results)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline.update(results)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline first.")
+        return 0
+    with open(args.baseline) as baseline_file:
+        regressions = compare(results, json.load(baseline_file), args.threshold)
+    if regressions:
+        print("Regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
 import arcade
 import random
 from games.IGame import IGame
-from arcade.types import Color
+from games.asset_manager import assets
+from games.brazil.fighter import FIGHTER_ANIMATIONS, load_animation, prefetch_animation
+from games.hud import TextLayer
+from games.scheduler import Scheduler
 
 # Game state
 MENU = 0
@@ -19,28 +22,32 @@ IDLE = 0
 KICK = 1
 DEAD = 2
 
-# Main Character
-ROWS = 4
-IDLE_COLS = 19
-KICK_COLS = 10
+# Main Character: the fighter animation played in each status
+STATUS_ANIMATIONS = {IDLE: 'idle', KICK: 'front_kick'}
+
+BACKGROUND_PATH = 'games/brazil/assets/background/background.png'
+CAPYBARA_PATH = 'games/brazil/assets/capybara/capybara.png'
 
 # Capybara
 WALK_COLS = 9
 WALK_ROWS = 9
 CAPYBARA_SIZE = 64
 ENEMY_SPEED = 300
+# Spawns per second; the old 79-in-10000 chance per frame, at 60 FPS
+ENEMY_SPAWN_RATE = 0.47
 
 class GameOverView(arcade.View):
     def __init__(self, final_score):
         super().__init__()
         self.final_score = int(final_score)
+        self.hud = TextLayer()
 
     def on_draw(self):
         self.clear()
-        arcade.Text("GAME OVER", self.window.width/2, self.window.height/2 + 50,
-                         arcade.color.RED, 40, anchor_x="center").draw()
-        arcade.Text(f"Final Score: {self.final_score}", self.window.width/2, self.window.height/2,
-                         arcade.color.WHITE, 20, anchor_x="center").draw()
+        self.hud.draw("title", "GAME OVER", self.window.width/2, self.window.height/2 + 50,
+                      arcade.color.RED, 40, anchor_x="center")
+        self.hud.draw("score", f"Final Score: {self.final_score}", self.window.width/2, self.window.height/2,
+                      arcade.color.WHITE, 20, anchor_x="center")
     def on_key_press(self, key, modifiers):
         if self.window and hasattr(self.window, "game_menu_view_instance"):
             print(f"Brazil Game finished (Game Over). Score: {self.final_score}")
@@ -61,13 +68,14 @@ class VictoryView(arcade.View):
     def __init__(self, final_score):
         super().__init__()
         self.final_score = int(final_score)
+        self.hud = TextLayer()
 
     def on_draw(self):
         self.clear()
-        arcade.Text("VICTORY!", self.window.width/2, self.window.height/2 + 50,
-                         arcade.color.GREEN, 40, anchor_x="center").draw()
-        arcade.Text(f"Final Score: {self.final_score}", self.window.width/2, self.window.height/2,
-                         arcade.color.WHITE, 20, anchor_x="center").draw()
+        self.hud.draw("title", "VICTORY!", self.window.width/2, self.window.height/2 + 50,
+                      arcade.color.GREEN, 40, anchor_x="center")
+        self.hud.draw("score", f"Final Score: {self.final_score}", self.window.width/2, self.window.height/2,
+                      arcade.color.WHITE, 20, anchor_x="center")
     def on_key_press(self, key, modifiers):
         if self.window and hasattr(self.window, "game_menu_view_instance"):
             print(f"Brazil Game finished (Victory). Score: {self.final_score}")
@@ -85,33 +93,41 @@ class VictoryView(arcade.View):
 
 
 class Player(arcade.Sprite):
-    def __init__(self, texture_list):
-        super().__init__(texture_list[0])
+    def __init__(self):
+        # status -> frames per direction; only the animations the player uses are loaded
+        self.animations = {status: load_animation(name) for status, name in STATUS_ANIMATIONS.items()}
+        super().__init__(self.animations[IDLE][UP][0])
+        self.scale = 5
+        self.reset()
+
+    def reset(self):
+        """Idle, facing right, at the start of the animation."""
         self.status = IDLE
-        self.textures = texture_list
         self.direction = RIGHT
-        self.cur_texture_index = self.direction * IDLE_COLS
+        self.frame = 0
         self.time_elapsed = 0
-        self.scale = 5
+        self.texture = self.animations[IDLE][UP][0]
+
+    def play(self, status):
+        """Start the animation for status from its first frame, in the current direction."""
+        self.status = status
+        self.frame = 0
 
     def update(self, delta_time=1/60, *args, **kwargs):
         self.time_elapsed += delta_time
+        frames = self.animations[self.status][self.direction]
 
         if self.time_elapsed > .1:
-            if self.cur_texture_index < len(self.textures):
-                self.set_texture(self.cur_texture_index)
-                self.cur_texture_index += 1
+            self.texture = frames[self.frame]
+            self.frame += 1
             self.time_elapsed = 0
-            
-        if self.status == KICK:
-            if self.cur_texture_index == (self.status*ROWS*IDLE_COLS)+(IDLE_COLS*self.direction+KICK_COLS)-1:
-                self.status = IDLE
-                self.cur_texture_index = IDLE_COLS * self.direction
-        elif self.cur_texture_index == (IDLE_COLS * (self.direction+1))-1:
-            self.cur_texture_index = IDLE_COLS * self.direction
+
+        # The last frame of a row is never shown: kicks go back to idle and idle loops one frame early
+        if self.frame == len(frames) - 1:
+            self.play(IDLE)
 
     def is_at_the_end_of_kick(self):
-        return self.status == KICK and self.cur_texture_index % IDLE_COLS > KICK_COLS - 6
+        return self.status == KICK and self.frame > FIGHTER_ANIMATIONS['front_kick'] - 6
 
 
 class Enemy(arcade.Sprite):
@@ -119,8 +135,13 @@ class Enemy(arcade.Sprite):
         super().__init__(texture_list[0])
         self.scale = 2
         self.textures = texture_list
+        self.reset()
+
+    def reset(self):
+        """Back to the first frame of the walk, for a new spawn."""
         self.cur_texture_index = WALK_COLS * (WALK_ROWS-1)
         self.time_elapsed = 0
+        self.texture = self.textures[0]
 
     def update(self, delta_time=1/60):
         self.center_x += self.change_x * delta_time
@@ -137,6 +158,9 @@ class Enemy(arcade.Sprite):
 
 
 class BrazilGame(IGame, arcade.View):
+    NAME = "Tha Brazil Game Thing"
+    COLOR = (0, 255, 0)
+
     def __init__(self):
         super().__init__()
         self.hp = 5
@@ -145,36 +169,48 @@ class BrazilGame(IGame, arcade.View):
         self.score = 0
         self.sprite_list = arcade.SpriteList()
         self.enemy_list = arcade.SpriteList()
+        # Capybaras that left the screen or were hit, reused by the next spawn
+        self.enemy_pool = []
+        self.scheduler = Scheduler()
         self.background_list = arcade.SpriteList()
+        self.hud = TextLayer()
 
-        self.background = arcade.Sprite('games/brazil/assets/background/background.png')
+        self.background = arcade.Sprite(assets.load_texture(BACKGROUND_PATH))
         self.background.center_x = self.window.width / 2
         self.background.center_y = self.window.height / 2
         self.background.width = self.window.width
         self.background.height = self.window.height
         self.background_list.append(self.background)
 
-        player_idle_sheet = arcade.load_spritesheet('games/brazil/assets/fighter/idle.png')
-        idle_list = player_idle_sheet.get_texture_grid(size=(100, 100), columns=IDLE_COLS, count=IDLE_COLS*ROWS)
-        player_kick_sheet = arcade.load_spritesheet('games/brazil/assets/fighter/front_kick.png')
-        kick_list = player_kick_sheet.get_texture_grid(size=(100, 100), columns=IDLE_COLS, count=IDLE_COLS*ROWS)
-
-        self.player = Player(idle_list + kick_list)
+        self.player = Player()
         self.player.position = 500, 400
 
-        capybara_sheet = arcade.load_spritesheet('games/brazil/assets/capybara/capybara.png')
-        self.capybara_list = capybara_sheet.get_texture_grid(size=(64, 64), columns=WALK_COLS, count=WALK_COLS*WALK_ROWS)
+        self.capybara_list = assets.texture_grid(CAPYBARA_PATH, size=(64, 64), columns=WALK_COLS, count=WALK_COLS*WALK_ROWS)
 
         self.sprite_list.append(self.background)
         self.sprite_list.append(self.player)
 
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode and slice the background and spritesheets on the asset prefetch workers."""
+        assets.prefetch_file(BACKGROUND_PATH)
+        for name in STATUS_ANIMATIONS.values():
+            prefetch_animation(name)
+        assets.prefetch_grid(CAPYBARA_PATH, size=(64, 64), columns=WALK_COLS, count=WALK_COLS*WALK_ROWS)
+
     def spawn_enemy(self):
         from_left = random.choice([True, False])
-        enemy = Enemy(self.capybara_list)
+        if self.enemy_pool:
+            enemy = self.enemy_pool.pop()
+            enemy.reset()
+        else:
+            # Every capybara shares the capybara_list textures
+            enemy = Enemy(self.capybara_list)
 
         if from_left:
             enemy.center_x = -CAPYBARA_SIZE
             enemy.change_x = ENEMY_SPEED
+            enemy.scale_x = 2
         else:
             enemy.center_x = self.window.width + CAPYBARA_SIZE
             enemy.change_x = -ENEMY_SPEED
@@ -184,14 +220,14 @@ class BrazilGame(IGame, arcade.View):
         self.enemy_list.append(enemy)
 
     def on_update(self, delta_time):
-        if random.randrange(10000) % 127 == 0:
-            self.spawn_enemy()
+        self.scheduler.advance(delta_time)
         self.sprite_list.update()
         self.enemy_list.update()
+        self.cull_enemies()
 
         hit_list = arcade.check_for_collision_with_list(self.player, self.enemy_list)
         for hit in hit_list:
-            hit.remove_from_sprite_lists()
+            self.release_enemy(hit)
             if self.player.is_at_the_end_of_kick():
                 self.score += 1 # Increased score increment from 0.5 to 1
                 if self.score >= 5: # Check if score reached or exceeded 5
@@ -202,49 +238,54 @@ class BrazilGame(IGame, arcade.View):
                 if self.hp == 0:
                     self.window.show_view(GameOverView(self.score))
 
+    def cull_enemies(self):
+        """Pool the capybaras that walked past the far edge, walking backwards so popping skips nothing."""
+        enemy_list = self.enemy_list
+        for index in range(len(enemy_list) - 1, -1, -1):
+            enemy = enemy_list[index]
+            # Mirror of the spawn points, just outside either edge
+            if enemy.center_x > self.window.width + CAPYBARA_SIZE or enemy.center_x < -CAPYBARA_SIZE:
+                enemy_list.pop(index)
+                self.enemy_pool.append(enemy)
+
+    def release_enemy(self, enemy):
+        self.enemy_list.remove(enemy)
+        self.enemy_pool.append(enemy)
+
     def on_draw(self):
         self.clear()
         self.sprite_list.draw()
         self.enemy_list.draw()
 
-        hp_text = f"HP: {self.hp}"
-        arcade.Text(
-            hp_text,
-            x=10,
-            y=self.win_h - 30,
-            color=arcade.color.RED,
-            font_size=20,
-            bold=True
-        ).draw()
-        score_text = f"Score: {self.score}"
-        arcade.Text(
-            score_text,
-            x=10,
-            y=self.win_h - 60,
-            color=arcade.color.WHITE,
-            font_size=20,
-            bold=True
-        ).draw()
+        self.hud.draw("hp", f"HP: {self.hp}", 10, self.win_h - 30, arcade.color.RED, 20, bold=True)
+        self.hud.draw("score", f"Score: {self.score}", 10, self.win_h - 60, arcade.color.WHITE, 20, bold=True)
 
     def on_key_press(self, key, _):
         if key == arcade.key.RIGHT:
             self.player.direction = RIGHT
-            self.player.cur_texture_index = self.player.status*IDLE_COLS*ROWS + self.player.direction * IDLE_COLS
+            self.player.play(self.player.status)
         elif key == arcade.key.LEFT:
             self.player.direction = LEFT
-            self.player.cur_texture_index = self.player.status*IDLE_COLS*ROWS + self.player.direction * IDLE_COLS
+            self.player.play(self.player.status)
         elif key == arcade.key.SPACE:
-            self.player.status = KICK
-            self.player.cur_texture_index = self.player.status*IDLE_COLS*ROWS + self.player.direction * IDLE_COLS
+            self.player.play(KICK)
 
     def run(self, window):
         self.win_w = window.width
         self.win_h = window.height
+        # Every round starts from scratch, with the enemies of the last one back in the pool
+        self.hp = 5
+        self.score = 0
+        while self.enemy_list:
+            self.enemy_pool.append(self.enemy_list.pop())
+        self.player.reset()
         self.player.position = (self.win_w / 2, self.win_h / 4)
+        self.scheduler.reset(random.getrandbits(32))
+        self.scheduler.poisson(ENEMY_SPAWN_RATE, self.spawn_enemy)
         window.show_view(self)
 
     def get_name(self):
-        return 'Tha Brazil Game Thing'
+        return self.NAME
 
     def get_color(self):
-        return Color(0, 255, 0)
+        return self.COLOR
@@ -0,0 +1,42 @@
+from games.asset_manager import assets
+
+FIGHTER_DIR = 'games/brazil/assets/fighter'
+FRAME_SIZE = (100, 100)
+# Every sheet has one row per direction: up, right, down, left
+DIRECTIONS = 4
+
+# Animation name -> frames per direction. The sheets are all 19 frames wide, but only
+# the idle row uses them all; the columns past the count are empty and never sliced.
+FIGHTER_ANIMATIONS = {
+    'death': 10,
+    'front_kick': 10,
+    'front_kick_recover': 5,
+    'idle': 19,
+    'jab': 4,
+    'jab_recover': 5,
+    'punch': 5,
+    'punch_recover': 6,
+    'run': 12,
+    'stagger': 2,
+    'stagger_recover': 4,
+}
+
+
+def fighter_sheet(name: str) -> str:
+    return f"{FIGHTER_DIR}/{name}.png"
+
+
+def load_animation(name: str):
+    """Frames of a fighter animation, one list per direction, loading its sheet on first use.
+
+    Frames are trimmed of the transparent padding around the fighter, so an animation
+    takes a fraction of the memory of its full 100x100 cells.
+    """
+    frames = FIGHTER_ANIMATIONS[name]
+    textures = assets.trimmed_grid(fighter_sheet(name), FRAME_SIZE, DIRECTIONS, frames)
+    return [textures[row * frames:(row + 1) * frames] for row in range(DIRECTIONS)]
+
+
+def prefetch_animation(name: str):
+    """Decode and trim an animation's sheet on the asset prefetch workers."""
+    assets.prefetch_trimmed_grid(fighter_sheet(name), FRAME_SIZE, DIRECTIONS, FIGHTER_ANIMATIONS[name])
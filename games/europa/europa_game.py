@@ -2,12 +2,14 @@ import arcade
 import random
 import os
 
-from arcade.types import Color
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.hud import ShapeLayer
 
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
-GLASS_IMG = os.path.join(ASSETS_DIR, "emptyglass.png")
-BACKGROUND_IMG = os.path.join(ASSETS_DIR, "bar.jpg")
+# Every image the game loads; prefetch_assets decodes the same ones
+IMAGE_PATHS = (os.path.join(ASSETS_DIR, "bar.jpg"), os.path.join(ASSETS_DIR, "emptyglass.png"))
+BACKGROUND_IMG, GLASS_IMG = IMAGE_PATHS
 
 TOTAL_BEERS = 5
 FILL_RATE_RANGE = (350, 600)
@@ -20,6 +22,9 @@ TOP_MARGIN_RATIO = 0.33
 
 
 class EuropaGame(IGame, arcade.View):
+    NAME = "Europa Bar Challenge"
+    COLOR = (0, 0, 255)
+
     def __init__(self):
         super().__init__(window=None)
         self._init_state()
@@ -35,13 +40,22 @@ class EuropaGame(IGame, arcade.View):
         self.result_text = arcade.Text("", 0, 0, arcade.color.WHITE, 24, anchor_x="center")
 
     def _load_assets(self):
-        self.background_sprite = arcade.Sprite(BACKGROUND_IMG) if os.path.exists(BACKGROUND_IMG) else None
-        self.glass_sprite = arcade.Sprite(GLASS_IMG, scale=1.0) if os.path.exists(GLASS_IMG) else None
+        self.background_sprite = arcade.Sprite(assets.load_texture(BACKGROUND_IMG)) if os.path.exists(BACKGROUND_IMG) else None
+        self.glass_sprite = arcade.Sprite(assets.load_texture(GLASS_IMG), scale=1.0) if os.path.exists(GLASS_IMG) else None
         self.background_list = arcade.SpriteList()
         self.glass_list = arcade.SpriteList()
+        # The beer goes under the glass and the target line over it
+        self.beer_shapes = ShapeLayer()
+        self.line_shapes = ShapeLayer()
         if self.background_sprite: self.background_list.append(self.background_sprite)
         if self.glass_sprite: self.glass_list.append(self.glass_sprite)
 
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode the bar and the empty glass in the background."""
+        for path in IMAGE_PATHS:
+            assets.prefetch_file(path)
+
     def on_show_view(self):
         self._init_state() # Reset all game state variables
         arcade.set_background_color(arcade.color.BLACK)
@@ -84,29 +98,28 @@ class EuropaGame(IGame, arcade.View):
         self.clear()
         self.background_list.draw()
         if not self.glass_sprite: return
-        self._draw_beer()
+        self._update_beer()
+        self.beer_shapes.draw()
         self.glass_list.draw()
-        self._draw_target_line()
+        self._update_target_line()
+        self.line_shapes.draw()
         self.result_text.draw()
 
-    def _draw_beer(self):
-        if self.beer_level <= 0: return
+    def _update_beer(self):
+        if self.beer_level <= 0:
+            self.beer_shapes.hide("beer")
+            return
         width = self.glass_sprite.width * BEER_WIDTH_RATIO
         x = self.glass_sprite.center_x - width / 2
         bottom = self.glass_sprite.bottom + self.glass_sprite.height * BOTTOM_MARGIN_RATIO
-        arcade.draw_lrbt_rectangle_filled(
-            left=x, right=x + width,
-            top=bottom + self.beer_level,
-            bottom=bottom,
-            color=arcade.color.YELLOW
-        )
-
-    def _draw_target_line(self):
+        self.beer_shapes.set_lrbt("beer", x, x + width, bottom, bottom + self.beer_level, arcade.color.YELLOW)
+
+    def _update_target_line(self):
         width = self.glass_sprite.width * BEER_WIDTH_RATIO
         start_x = self.glass_sprite.center_x - width / 2
-        end_x = self.glass_sprite.center_x + width / 2
-        arcade.draw_line(start_x, self.target_line_y, end_x, self.target_line_y,
-                         arcade.color.RED, LINE_THICKNESS)
+        self.line_shapes.set_lrbt("target", start_x, start_x + width,
+                                  self.target_line_y - LINE_THICKNESS / 2, self.target_line_y + LINE_THICKNESS / 2,
+                                  arcade.color.RED)
 
     def on_update(self, delta_time):
         if self.game_state == "FILLING":
@@ -170,7 +183,7 @@ class EuropaGame(IGame, arcade.View):
         window.show_view(self)
 
     def get_name(self):
-        return "Europa Bar Challenge"
+        return self.NAME
 
     def get_color(self):
-        return Color(0, 0, 255)
+        return self.COLOR
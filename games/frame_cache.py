@@ -0,0 +1,117 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Callable
+
+from PIL import Image
+
+from games.asset_manager import PROJECT_ROOT, resolve_path
+
+CACHE_DIR = os.environ.get("JAM_TRAVEL_CACHE_DIR") or os.path.join(PROJECT_ROOT, ".cache", "frames")
+
+# File layout: magic, format version, width, height, 4-byte mode name, then raw pixels
+HEADER = struct.Struct("<4sIII4s")
+MAGIC = b"JTFC"
+VERSION = 1
+
+
+class FrameCache:
+    """Content-addressed on-disk cache of derived images (crops, rescales, region grids).
+
+    Keys hash the source file's contents together with every parameter of the
+    transformation, so editing an asset simply produces new keys and stale
+    entries are never read. Entries are raw pixel buffers that are memory-mapped
+    back without any decoding or resampling.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, enabled: bool = True):
+        self.directory = directory
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def source_hash(self, path: str) -> str:
+        """SHA-1 of a file's contents, memoized while its size and mtime are unchanged."""
+        path = resolve_path(path)
+        stat = os.stat(path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        digest = hashlib.sha1()
+        with open(path, "rb") as source:
+            for chunk in iter(lambda: source.read(1 << 20), b""):
+                digest.update(chunk)
+        with self._lock:
+            self._hashes[path] = (stamp, digest.hexdigest())
+        return digest.hexdigest()
+
+    def key(self, path: str, crop=None, scale=None, resample=None, size=None, extra=None) -> str:
+        """Cache key for the image derived from path with the given transformation."""
+        parts = {
+            "source": self.source_hash(path),
+            "crop": list(crop) if crop else None,
+            "scale": scale,
+            "resample": getattr(resample, "name", resample),
+            "size": list(size) if size else None,
+            "extra": extra,
+        }
+        return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.raw")
+
+    def load(self, key: str) -> Image.Image | None:
+        """Memory-map a cached image back, or return None on a miss or unreadable entry."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as entry:
+                mapped = mmap.mmap(entry.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        try:
+            magic, version, width, height, mode = HEADER.unpack_from(mapped)
+            mode = mode.rstrip(b"\0").decode()
+            if magic != MAGIC or version != VERSION:
+                return None
+            # Shares the mapped pages instead of copying them
+            return Image.frombuffer(mode, (width, height), memoryview(mapped)[HEADER.size:], "raw", mode, 0, 1)
+        except (struct.error, ValueError) as e:
+            print(f"Warning: ignoring unreadable frame cache entry {path}: {e}")
+            return None
+
+    def store(self, key: str, image: Image.Image):
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write next to the final name and rename, so readers never see a partial file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as entry:
+            entry.write(HEADER.pack(MAGIC, VERSION, image.width, image.height, image.mode.encode()))
+            entry.write(image.tobytes())
+        os.replace(temp_path, path)
+
+    def get_or_create(self, key: str, factory: Callable[[], Image.Image]) -> Image.Image:
+        """Return the cached image for key, or build it with factory and store it."""
+        if not self.enabled:
+            return factory()
+        image = self.load(key)
+        if image is not None:
+            self.hits += 1
+            return image
+        self.misses += 1
+        image = factory()
+        try:
+            self.store(key, image)
+        except OSError as e:
+            print(f"Warning: could not write frame cache entry: {e}")
+        return image
+
+
+# Shared instance used by the asset loaders
+frame_cache = FrameCache()
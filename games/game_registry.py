@@ -0,0 +1,84 @@
+import time
+from typing import Callable, List, Tuple
+
+from games.IGame import IGame
+from games.asset_manager import assets
+from games.profiler import profiler
+
+
+class RegisteredGame(IGame):
+    """Registry entry for a minigame: its metadata plus a factory that builds it on demand.
+
+    The menu only needs the name and colour, read from the game class's ``NAME`` and
+    ``COLOR`` (the same attributes its ``get_name``/``get_color`` return), so the real
+    game (and all of its assets) is constructed the first time it is run and reused
+    afterwards. If the factory has a ``prefetch_assets(window_size)`` static method,
+    ``prefetch`` uses it to start decoding the game's images in the background before
+    it is built.
+    """
+
+    def __init__(self, name: str, color: Tuple[int, int, int], factory: Callable[[], IGame]):
+        self.name = name
+        self.color = color
+        self.factory = factory
+        self.build_time = None
+        self.prefetched = False
+        self._instance = None
+
+    @property
+    def instance(self) -> IGame:
+        if self._instance is None:
+            start = time.perf_counter()
+            # Only recorded when profiling; --startup-report prints build_time
+            with profiler.span(f"build {self.name}"):
+                self._instance = self.factory()
+                # Pack the new textures now rather than on the game's first frame
+                assets.upload()
+            self.build_time = time.perf_counter() - start
+        return self._instance
+
+    def is_built(self) -> bool:
+        return self._instance is not None
+
+    def prefetch(self, window_size=None):
+        """Start decoding this game's assets on the prefetch workers, at most once."""
+        if self.prefetched or self.is_built():
+            return
+        self.prefetched = True
+        prefetch_assets = getattr(self.factory, "prefetch_assets", None)
+        if prefetch_assets:
+            prefetch_assets(window_size)
+
+    def run(self, window=None):
+        return self.instance.run(window)
+
+    def get_name(self):
+        return self.name
+
+    def get_color(self):
+        return self.color
+
+
+class GameRegistry:
+    """Ordered collection of registered minigames."""
+
+    def __init__(self):
+        self.entries: List[RegisteredGame] = []
+
+    def register(self, factory: Callable[[], IGame]) -> RegisteredGame:
+        """Register a game class; its name and colour come from its NAME and COLOR attributes."""
+        entry = RegisteredGame(factory.NAME, tuple(factory.COLOR), factory)
+        self.entries.append(entry)
+        return entry
+
+    def get(self, name: str) -> RegisteredGame | None:
+        for entry in self.entries:
+            if entry.name == name:
+                return entry
+        return None
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
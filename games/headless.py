@@ -0,0 +1,230 @@
+"""Headless simulation harness: drive any IGame at a fixed timestep without a display.
+
+Run from the project root, e.g.::
+
+    python -m games.headless --game "Duck Hunt USA" --seconds 20 --event 1.0:click:400,500
+
+Arcade's headless mode renders offscreen through EGL, so this works on a CI box
+with no display. Set ``ARCADE_HEADLESS=1`` before arcade is first imported when
+using the runner from other code; importing this module first does it for you.
+"""
+import os
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import argparse
+import random
+import time
+from typing import Callable, List, Tuple
+
+import arcade
+
+from games.IGame import IGame
+from games.asset_manager import assets
+
+DEFAULT_SIZE = (1280, 720)
+DEFAULT_DELTA_TIME = 1 / 60
+
+
+class ScriptEvent:
+    """One scripted input, fired on the first frame at or after ``time`` seconds."""
+
+    def __init__(self, time: float, action: str, *args):
+        self.time = time
+        self.action = action
+        self.args = args
+
+    def dispatch(self, view: arcade.View):
+        if self.action == "press":
+            view.on_key_press(self.args[0], 0)
+        elif self.action == "release":
+            view.on_key_release(self.args[0], 0)
+        elif self.action == "click":
+            x, y = self.args[:2]
+            button = self.args[2] if len(self.args) > 2 else arcade.MOUSE_BUTTON_LEFT
+            view.on_mouse_press(x, y, button, 0)
+            view.on_mouse_release(x, y, button, 0)
+        elif self.action == "move":
+            x, y = self.args
+            view.on_mouse_motion(x, y, 0, 0)
+        else:
+            raise ValueError(f"Unknown script action '{self.action}'")
+
+
+def press(time: float, key: int) -> ScriptEvent:
+    return ScriptEvent(time, "press", key)
+
+
+def release(time: float, key: int) -> ScriptEvent:
+    return ScriptEvent(time, "release", key)
+
+
+def tap(time: float, key: int, duration: float = DEFAULT_DELTA_TIME) -> List[ScriptEvent]:
+    """Press and release a key, held for ``duration`` seconds."""
+    return [press(time, key), release(time + duration, key)]
+
+
+def click(time: float, x: float, y: float, button: int = arcade.MOUSE_BUTTON_LEFT) -> ScriptEvent:
+    return ScriptEvent(time, "click", x, y, button)
+
+
+class MenuStub(arcade.View):
+    """Stands in for the game menu so games can "return" to it and report their score."""
+
+    def on_draw(self):
+        self.clear()
+
+
+class RunResult:
+    def __init__(self):
+        self.score = None
+        self.finished = False
+        self.frames = 0
+        self.sim_time = 0.0
+        self.wall_time = 0.0
+        self.update_times: List[float] = []
+        self.draw_times: List[float] = []
+        # Asset manager activity during the run, building the game included
+        self.disk_loads = 0
+        self.texture_loads = 0
+
+    def __repr__(self):
+        return (f"RunResult(score={self.score}, finished={self.finished}, frames={self.frames}, "
+                f"sim_time={self.sim_time:.2f}s, wall_time={self.wall_time:.2f}s, "
+                f"disk_loads={self.disk_loads}, texture_loads={self.texture_loads})")
+
+
+class HeadlessRunner:
+    """Steps a game's views at a fixed ``delta_time``, as fast as the CPU allows.
+
+    The game is built and ``run`` against a headless window whose
+    ``game_menu_view_instance`` is a stub. A run ends when the game shows the
+    stub again (its score is then read from ``window.last_game_score``), when a
+    game returns its score directly from ``run``, or after ``max_seconds`` of
+    simulated time. Per-frame ``on_update``/``on_draw`` wall times are recorded.
+    """
+
+    def __init__(self, size: Tuple[int, int] = DEFAULT_SIZE, delta_time: float = DEFAULT_DELTA_TIME,
+                 render: bool = True):
+        self.delta_time = delta_time
+        self.render = render
+        self.window = get_headless_window(size)
+        self.menu = MenuStub(self.window)
+
+    def run(self, factory: Callable[[], IGame], script: List[ScriptEvent] = (), max_seconds: float = 60.0,
+            seed: int | None = None, on_frame: Callable[[int, arcade.View], None] | None = None) -> RunResult:
+        if seed is not None:
+            random.seed(seed)
+        window = self.window
+        window.game_menu_view_instance = self.menu
+        window.show_view(self.menu)
+        if hasattr(window, "last_game_score"):
+            del window.last_game_score
+
+        result = RunResult()
+        disk_loads, texture_loads = assets.disk_loads, assets.texture_loads
+        game = factory()
+        started = time.perf_counter()
+        direct_score = game.run(window)
+        if direct_score is not None:
+            result.score = direct_score
+            result.finished = True
+            result.wall_time = time.perf_counter() - started
+            result.disk_loads = assets.disk_loads - disk_loads
+            result.texture_loads = assets.texture_loads - texture_loads
+            return result
+
+        events = sorted(script, key=lambda event: event.time)
+        next_event = 0
+        max_frames = int(max_seconds / self.delta_time)
+        while result.frames < max_frames:
+            sim_time = result.frames * self.delta_time
+            while next_event < len(events) and events[next_event].time <= sim_time:
+                events[next_event].dispatch(window.current_view)
+                next_event += 1
+            if window.current_view is self.menu:
+                break
+
+            view = window.current_view
+            update_start = time.perf_counter()
+            view.on_update(self.delta_time)
+            result.update_times.append(time.perf_counter() - update_start)
+            if self.render and window.current_view is view:
+                draw_start = time.perf_counter()
+                view.on_draw()
+                # Wait for the GPU so queued work is charged to the frame that issued it
+                window.ctx.finish()
+                result.draw_times.append(time.perf_counter() - draw_start)
+            result.frames += 1
+            if on_frame:
+                on_frame(result.frames, view)
+            if window.current_view is self.menu:
+                break
+
+        result.finished = window.current_view is self.menu
+        result.score = getattr(window, "last_game_score", None)
+        result.sim_time = result.frames * self.delta_time
+        result.wall_time = time.perf_counter() - started
+        result.disk_loads = assets.disk_loads - disk_loads
+        result.texture_loads = assets.texture_loads - texture_loads
+        window.show_view(self.menu)
+        return result
+
+
+def get_headless_window(size: Tuple[int, int] = DEFAULT_SIZE) -> arcade.Window:
+    """Reuse the current arcade window, or open an offscreen one."""
+    try:
+        return arcade.get_window()
+    except RuntimeError:
+        return arcade.Window(size[0], size[1], "EPITECH JAM TRAVEL (headless)", visible=False)
+
+
+def parse_event(spec: str) -> ScriptEvent:
+    """Parse ``TIME:ACTION:ARG`` where ACTION is press/release/tap/click and ARG a key name or x,y."""
+    event_time, action, arg = spec.split(":", 2)
+    event_time = float(event_time)
+    if action in ("click", "move"):
+        x, y = (float(v) for v in arg.split(","))
+        return ScriptEvent(event_time, action, x, y)
+    key = getattr(arcade.key, arg.upper())
+    return ScriptEvent(event_time, action, key)
+
+
+def main():
+    from main import create_registry
+
+    registry = create_registry()
+    parser = argparse.ArgumentParser(description="Run a minigame headless at a fixed timestep")
+    parser.add_argument("--game", required=True, choices=[game.get_name() for game in registry])
+    parser.add_argument("--seconds", type=float, default=30.0, help="maximum simulated time")
+    parser.add_argument("--fps", type=float, default=60.0, help="simulation ticks per simulated second")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-render", action="store_true", help="only call on_update")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="play the same game instance this many times, as the menu would")
+    parser.add_argument("--event", action="append", default=[],
+                        help="scripted input TIME:ACTION:ARG, e.g. 0.5:press:SPACE or 2:click:400,300")
+    args = parser.parse_args()
+
+    script = []
+    for spec in args.event:
+        if ":tap:" in spec:
+            event_time, _, key = spec.split(":", 2)
+            script.extend(tap(float(event_time), getattr(arcade.key, key.upper())))
+        else:
+            script.append(parse_event(spec))
+
+    runner = HeadlessRunner(delta_time=1 / args.fps, render=not args.no_render)
+    entry = registry.get(args.game)
+    for _ in range(args.runs):
+        # The registry builds the game once; later runs reuse it like the menu does
+        result = runner.run(lambda: entry.instance, script, max_seconds=args.seconds, seed=args.seed)
+        print(result)
+        if result.update_times:
+            print(f"mean update: {sum(result.update_times) / len(result.update_times) * 1000:.3f} ms")
+        if result.draw_times:
+            print(f"mean draw:   {sum(result.draw_times) / len(result.draw_times) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import arcade
+
+
+class TextLayer:
+    """Persistent arcade.Text objects, one per label name.
+
+    A label is created the first time its name is drawn; afterwards only its string
+    and position are updated, and arcade re-lays out the glyphs only when the string
+    actually changed. Color, size and other style arguments are fixed at creation.
+    """
+
+    def __init__(self):
+        self.labels = {}
+
+    def get(self, name: str, text: str, x: float, y: float, color=arcade.color.WHITE, font_size: float = 12,
+            **style) -> arcade.Text:
+        label = self.labels.get(name)
+        if label is None:
+            label = arcade.Text(text, x, y, color, font_size, **style)
+            self.labels[name] = label
+            return label
+        label.text = text
+        if label.x != x or label.y != y:
+            label.position = (x, y)
+        return label
+
+    def draw(self, name: str, text: str, x: float, y: float, color=arcade.color.WHITE, font_size: float = 12,
+             **style):
+        self.get(name, text, x, y, color, font_size, **style).draw()
+
+    def clear(self):
+        self.labels.clear()
+
+
+class ShapeLayer:
+    """Retained rectangles batched into one SpriteList, drawn with a single call.
+
+    Each named rectangle is a solid color sprite. Static rectangles are uploaded once;
+    moving or resizing one only rewrites its own slot in the vertex buffer, and
+    setting an unchanged rectangle again costs nothing.
+    """
+
+    def __init__(self):
+        self.sprite_list = arcade.SpriteList()
+        self.rects = {}
+
+    def set_lrbt(self, name: str, left: float, right: float, bottom: float, top: float, color=arcade.color.WHITE):
+        rect = (left, right, bottom, top)
+        entry = self.rects.get(name)
+        if entry is None:
+            sprite = arcade.SpriteSolidColor(1, 1, color=color)
+            self.sprite_list.append(sprite)
+            entry = self.rects[name] = [sprite, None]
+        sprite = entry[0]
+        if entry[1] != rect:
+            entry[1] = rect
+            width = right - left
+            height = top - bottom
+            sprite.visible = width > 0 and height > 0
+            if sprite.visible:
+                sprite.size = (width, height)
+                sprite.position = (left + width / 2, bottom + height / 2)
+        if sprite.color != color:
+            sprite.color = color
+
+    def set_lbwh(self, name: str, left: float, bottom: float, width: float, height: float, color=arcade.color.WHITE):
+        self.set_lrbt(name, left, left + width, bottom, bottom + height, color)
+
+    def hide(self, name: str):
+        """Hide a rectangle until it is set again."""
+        entry = self.rects.get(name)
+        if entry and entry[1] is not None:
+            entry[1] = None
+            entry[0].visible = False
+
+    def draw(self):
+        self.sprite_list.draw()
@@ -2,40 +2,81 @@ import arcade
 import random
 import os
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Tuple
 
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.hud import TextLayer
+from games.profiler import profiler
 from arcade.types import Rect
 
 CUT_ZONE_TOP = 150
 CUT_ZONE_BOTTOM = 100
 MARGIN = 65
+# A sushi can be sliced while its center is inside this band
+CUT_BAND_BOTTOM = 50
+CUT_BAND_TOP = 150
+HALF_LIFETIME = 0.5
+SUSHI_SCALE = 0.35
+HALF_SCALE = 0.5
+LIFE_SCALE = 0.17
+LIFE_SPACING = 10
+LIFE_Y = 40
+# Simulation ticks per second; slices are timed on the game clock, so fewer ticks lose no hits
+TICK_RATE = 60
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+# Every image the game loads; prefetch_assets decodes the same ones
+IMAGE_PATHS = tuple(os.path.join(ASSETS_DIR, name) for name in
+                    ("japangamebg.jpg", "sushi.png", "sushi_half_left.png", "sushi_half_right.png", "sakurahealth.png"))
+BACKGROUND_PATH, SUSHI_PATH, SUSHI_LEFT_PATH, SUSHI_RIGHT_PATH, LIFE_PATH = IMAGE_PATHS
 
 class JapanGame(IGame, arcade.View):
-    def __init__(self):
+    NAME = "Sushi Rampage"
+    COLOR = (255, 0, 254)
+
+    def __init__(self, tick_rate=TICK_RATE):
         super().__init__()
 
         self.title = "Japan - Sushi Rampage"
-        self.assets_path = os.path.join(os.path.dirname(__file__), "assets")
+        self.assets_path = ASSETS_DIR
         self.score = 0
         self.sushi_health = 8
         self.sushi_speed = 600
         self.spawn_timer = 0
         self.spawn_interval = 1.5
         self.game_over_text = "GAME OVER!"
-        self.background_texture = arcade.load_texture(
-            os.path.join(self.assets_path, "japangamebg.jpg")
-        )
+        self.hud = TextLayer()
+        self.background_texture = assets.load_texture(BACKGROUND_PATH)
         self.background_rect = Rect(0, self.window.width, self.window.height, 0, self.window.width, self.window.height, self.window.width / 2, self.window.height / 2)
         self.sushi_list = arcade.SpriteList()
         self.cut_sprites = arcade.SpriteList()
-        self.cut_timers = []
+        # Every sushi falls at the same speed, so spawn order is also height order: lowest first
+        self.sushi_queue = deque()
+        # (expiry time, half) in expiry order, since every half lives HALF_LIFETIME
+        self.cut_expiry = deque()
+        self.clock = 0.0
+        self.tick = 1 / tick_rate
+        self.tick_accumulator = 0.0
+        self.tick_speed = self.sushi_speed
+        # Game clock at the end of the last frame, to stamp key presses
+        self.frame_clock = 0.0
+        # Clock times of SPACE presses the simulation has not reached yet
+        self.pending_cuts = deque()
         self.cut_sound = None
         self.life_sprites = arcade.SpriteList()
+        # Sprites no longer on screen, reused by the next spawn or slice
+        self.sushi_pool = []
+        self.half_pool = []
+        self.life_icons = []
         self._load_assets()
 
     def _load_assets(self):
-        """Load game assets (background, sounds)"""
+        """Load game assets (textures, sounds)"""
+        self.sushi_texture = assets.load_texture(SUSHI_PATH)
+        self.sushi_left_texture = assets.load_texture(SUSHI_LEFT_PATH)
+        self.sushi_right_texture = assets.load_texture(SUSHI_RIGHT_PATH)
+        self.life_texture = assets.load_texture(LIFE_PATH)
         try:
             self.cut_sound = arcade.load_sound(
                 os.path.join(self.assets_path, "cut.wav")
@@ -44,11 +85,17 @@ class JapanGame(IGame, arcade.View):
             pass
 
 
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode the backdrop, the sushi, its two halves and the sakura life icon ahead of time."""
+        for path in IMAGE_PATHS:
+            assets.prefetch_file(path)
+
     def get_name(self) -> str:
-        return "Sushi Rampage"
+        return self.NAME
 
     def get_color(self) -> Tuple[int, int, int]:
-        return (255, 0, 254)
+        return self.COLOR
 
     def run(self, window: arcade.Window) -> int:
         """Run the game and return the score"""
@@ -62,9 +109,17 @@ class JapanGame(IGame, arcade.View):
         self.score = 0
         self.sushi_health = 6
         self.sushi_speed = 600
-        self.sushi_list = arcade.SpriteList()
-        self.cut_sprites = arcade.SpriteList()
-        self.cut_timers = []
+        while self.sushi_list:
+            self.sushi_pool.append(self.sushi_list.pop())
+        while self.cut_sprites:
+            self.half_pool.append(self.cut_sprites.pop())
+        self.sushi_queue.clear()
+        self.cut_expiry.clear()
+        self.clock = 0.0
+        self.tick_accumulator = 0.0
+        self.frame_clock = 0.0
+        self.pending_cuts.clear()
+        self.rect_color = arcade.color.RED
         self.window.set_mouse_visible(True)
         self._update_life_sprites()
 
@@ -73,7 +128,8 @@ class JapanGame(IGame, arcade.View):
         self.clear()
         arcade.draw_texture_rect(self.background_texture, self.background_rect)
         if self.sushi_health <= 0:
-            arcade.draw_text(
+            self.hud.draw(
+                "game_over",
                 self.game_over_text,
                 self.window.width / 2,
                 self.window.height / 2,
@@ -83,14 +139,16 @@ class JapanGame(IGame, arcade.View):
             )
             return
         
-        arcade.draw_text(
+        self.hud.draw(
+            "instructions",
             "    Press SPACE to slice the sushi!",
             self.window.width * 0.25,
             self.window.height * 0.85,
             arcade.color.BLACK, 46
         )
         
-        arcade.draw_text(
+        self.hud.draw(
+            "score",
             f"Score: {self.score}",
             10,
             self.window.height - 65,
@@ -108,8 +166,18 @@ class JapanGame(IGame, arcade.View):
         self.life_sprites.draw()
 
     def on_update(self, delta_time):
-        """Game logic update"""
+        """Game logic update, run as fixed ticks of ``self.tick`` seconds"""
+        self.frame_clock += delta_time
+        self.tick_accumulator += delta_time
+        while self.tick_accumulator >= self.tick:
+            self.tick_accumulator -= self.tick
+            self._tick(self.tick)
+
+    def _tick(self, delta_time):
+        """Advance the game by one fixed tick"""
         self.rect_color = arcade.color.RED 
+        tick_start = self.clock
+        self.clock += delta_time
 
         if self.sushi_health > 0:
             self.spawn_timer += delta_time
@@ -118,47 +186,77 @@ class JapanGame(IGame, arcade.View):
                 self._spawn_sushi(x, self.window.height)
                 self.spawn_timer = 0
 
+            self.tick_speed = self.sushi_speed
             for sushi in self.sushi_list:
-                sushi.center_y -= self.sushi_speed * delta_time
-                if sushi.center_y < 0:
-                    self.sushi_list.remove(sushi)
-                    self.sushi_health -= 1
-                    self._update_life_sprites()
-            
+                sushi.center_y -= self.tick_speed * delta_time
+
+            # Slices pressed during this tick are tested where the sushi were at the press,
+            # before misses are counted, so a sushi that crossed the band mid-tick can still be cut
+            while self.pending_cuts and self.pending_cuts[0] <= self.clock:
+                pressed_at = max(self.pending_cuts.popleft(), tick_start)
+                self._attempt_cut(self.clock - pressed_at)
+
+            # Missed sushi are always at the front of the queue
+            while self.sushi_queue and self.sushi_queue[0].center_y < 0:
+                sushi = self.sushi_queue.popleft()
+                self.sushi_list.remove(sushi)
+                self.sushi_pool.append(sushi)
+                self.sushi_health -= 1
+                self._update_life_sprites()
+            if self.sushi_health <= 0:
+                self.pending_cuts.clear()  # nothing tests them after the game is over
+
             self._update_cut_pieces(delta_time)
             
             
-            if any(CUT_ZONE_BOTTOM - MARGIN < sushi.center_y < CUT_ZONE_TOP + MARGIN for sushi in self.sushi_list):
+            sushi = self._lowest_sushi_above(CUT_ZONE_BOTTOM - MARGIN)
+            if sushi and sushi.center_y < CUT_ZONE_TOP + MARGIN:
                 self.rect_color = arcade.color.WHITE
 
+    @profiler.trace("_update_life_sprites")
     def _update_life_sprites(self):
         """Met à jour les icônes de vies affichées."""
-        self.life_sprites = arcade.SpriteList()
-        spacing = 10
-        icon_path = os.path.join(self.assets_path, "sakurahealth.png")
-    
-        sample_sprite = arcade.Sprite(icon_path, scale=0.3)
-        icon_width = sample_sprite.width
-        total_width = self.sushi_health * icon_width + (self.sushi_health - 1) * spacing
-        start_x = (self.window.width - total_width) / 2
-        y = 40
+        # Only the icons gained or lost are added or removed; the rest are re-centered
+        lives = max(self.sushi_health, 0)
+        while len(self.life_icons) < lives:
+            self.life_icons.append(arcade.Sprite(self.life_texture, scale=LIFE_SCALE))
+        while len(self.life_sprites) > lives:
+            self.life_sprites.pop()
+        while len(self.life_sprites) < lives:
+            self.life_sprites.append(self.life_icons[len(self.life_sprites)])
 
-        for i in range(self.sushi_health):
-            x = start_x + i * (icon_width + spacing)
-            sprite = arcade.Sprite(icon_path, scale=0.17)
-            sprite.center_x = x
-            sprite.center_y = y
-            self.life_sprites.append(sprite)
+        # Icons are spaced as if drawn at scale 0.3
+        icon_width = self.life_texture.width * 0.3
+        total_width = lives * icon_width + (lives - 1) * LIFE_SPACING
+        start_x = (self.window.width - total_width) / 2
+        for i, sprite in enumerate(self.life_sprites):
+            sprite.position = (start_x + i * (icon_width + LIFE_SPACING), LIFE_Y)
 
     def _spawn_sushi(self, x, y):
         """Create new sushi at position"""
-        sushi = arcade.Sprite(
-            os.path.join(self.assets_path, "sushi.png"), 
-            scale=0.35
-        )
-        sushi.center_x = x
-        sushi.center_y = y
+        sushi = self.sushi_pool.pop() if self.sushi_pool else arcade.Sprite(self.sushi_texture, scale=SUSHI_SCALE)
+        sushi.position = (x, y)
         self.sushi_list.append(sushi)
+        self.sushi_queue.append(sushi)
+
+    def _lowest_sushi_above(self, y):
+        """Lowest sushi whose center is above ``y``, or None.
+
+        The queue is sorted by height, so this stops at the first match; only the
+        sushi already below ``y`` (at most one at the spawn rate) are skipped.
+        """
+        for sushi in self.sushi_queue:
+            if sushi.center_y > y:
+                return sushi
+        return None
+
+    def _take_half(self, texture, x, y, change_x):
+        """Get a cut half from the pool, or a new one when every half is on screen."""
+        half = self.half_pool.pop() if self.half_pool else arcade.Sprite(texture, scale=HALF_SCALE)
+        half.texture = texture
+        half.position = (x, y)
+        half.change_x = change_x
+        return half
 
     def _update_cut_pieces(self, delta_time):
         """Update cut sushi pieces"""
@@ -166,15 +264,20 @@ class JapanGame(IGame, arcade.View):
             sprite.center_x += sprite.change_x * delta_time
             sprite.center_y -= 50 * delta_time
 
-        self.cut_timers = [t - delta_time for t in self.cut_timers]
-        while self.cut_timers and self.cut_timers[0] <= 0:
-            self.cut_sprites.pop(0)
-            self.cut_timers.pop(0)
+        while self.cut_expiry and self.cut_expiry[0][0] <= self.clock:
+            _, half = self.cut_expiry.popleft()
+            self.cut_sprites.remove(half)
+            self.half_pool.append(half)
 
     def on_key_press(self, key, modifiers):
         """Handle keyboard input"""
         if key == arcade.key.SPACE:
-            self._attempt_cut()
+            # Once the game is over no tick tests cuts anymore, so don't queue them
+            if self.sushi_health <= 0:
+                return
+            # Stamp the press with the game clock only, never the wall clock, so a scripted
+            # run cuts the same sushi whatever the host's speed; the next tick that reaches it tests the cut
+            self.pending_cuts.append(self.frame_clock)
         elif key == arcade.key.ESCAPE:
             self._return_to_menu(save_score=False)
 
@@ -193,37 +296,29 @@ class JapanGame(IGame, arcade.View):
                 self.window.close()
 
 
-    def _attempt_cut(self):
-        """Try to cut sushi in the cut zone"""
-        for sushi in self.sushi_list:
-            if 50 < sushi.center_y < 150:
-                self._cut_sushi(sushi)
-                break
+    def _attempt_cut(self, since=0.0):
+        """Try to cut the lowest sushi that was in the cut zone ``since`` seconds ago"""
+        # Over the tick every sushi moved straight down at tick_speed, so back then it was this much higher
+        rise = self.tick_speed * since
+        sushi = self._lowest_sushi_above(CUT_BAND_BOTTOM - rise)
+        if sushi and sushi.center_y + rise < CUT_BAND_TOP:
+            self._cut_sushi(sushi)
 
     def _cut_sushi(self, sushi):
         """Cut a sushi into pieces"""
+        # The cut sushi is the lowest in the band, so it sits at the front of the queue
+        self.sushi_queue.remove(sushi)
         self.sushi_list.remove(sushi)
+        self.sushi_pool.append(sushi)
         self.score += 1
         self.sushi_speed += 175
 
-        left = arcade.Sprite(
-            os.path.join(self.assets_path, "sushi_half_left.png"),
-            scale=0.5
-        )
-        left.center_x = sushi.center_x
-        left.center_y = sushi.center_y
-        left.change_x = -150
-
-        right = arcade.Sprite(
-            os.path.join(self.assets_path, "sushi_half_right.png"),
-            scale=0.5
-        )
-        right.center_x = sushi.center_x
-        right.center_y = sushi.center_y
-        right.change_x = 150
-
-        self.cut_sprites.extend([left, right])
-        self.cut_timers.extend([0.5, 0.5])
+        x, y = sushi.position
+        expires = self.clock + HALF_LIFETIME
+        for texture, change_x in ((self.sushi_left_texture, -150), (self.sushi_right_texture, 150)):
+            half = self._take_half(texture, x, y, change_x)
+            self.cut_sprites.append(half)
+            self.cut_expiry.append((expires, half))
 
         if self.cut_sound:
             arcade.play_sound(self.cut_sound)
@@ -1,11 +1,29 @@
 import arcade
 import os
-from PIL import Image
 import math
 import random
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.hud import ShapeLayer
+from games.menu.region_grid import RegionGrid, load_region_grid
 from typing import List, Tuple
 
+COLOR_MAP_PATH = os.path.join(os.path.dirname(__file__), "assets", "backmap2.jpg")
+
+def create_region_color_map(games: List[IGame]) -> dict[Tuple[int, int, int], IGame]:
+    """Maps each game's colour, rounded to the color map's palette, to the game."""
+    color_map = {}
+    for game in games:
+        color_tuple = game.get_color()
+        if color_tuple:
+            if isinstance(color_tuple, list):
+                color_tuple = tuple(color_tuple)
+            if len(color_tuple) == 4:
+                color_tuple = color_tuple[:3]
+            rounded_color = tuple(int(round(c / 125) * 125) for c in color_tuple)
+            color_map[rounded_color] = game
+    return color_map
+
 class GameMenu(arcade.View):
     def __init__(self, playable_games: List[IGame], window: arcade.Window):
         super().__init__()
@@ -29,14 +47,10 @@ class GameMenu(arcade.View):
         self.min_speed_factor = 0.9
         self.max_speed_factor = 1.5
         self.display_map_path = os.path.join(os.path.dirname(__file__), "assets", "earthmap.jpg")
-        self.color_map_path = os.path.join(os.path.dirname(__file__), "assets", "backmap2.jpg")
-        try:
-            self.color_pil_image = Image.open(self.color_map_path).convert("RGB")
-        except FileNotFoundError:
-            print(f"Error: Color map file not found at {self.color_map_path}")
-            self.color_pil_image = None
+        self.color_map_path = COLOR_MAP_PATH
+        self.region_grid = self._build_region_grid()
         try:
-            self.background_sprite = arcade.Sprite(self.display_map_path)
+            self.background_sprite = arcade.Sprite(assets.load_texture(self.display_map_path))
             self.background_list = arcade.SpriteList()
             self.background_list.append(self.background_sprite)
             if self.window:
@@ -66,24 +80,25 @@ class GameMenu(arcade.View):
             10, self.window.height - 30 if self.window else 700,
             arcade.color.WHITE, font_size=16
         )
+        self.bar_shapes = ShapeLayer()
         self.waiting_for_view_score = False
         self.current_game_instance = None
+        self.prefetch_region_id = None
 
     def _create_color_map(self) -> dict[Tuple[int, int, int], IGame]:
-        color_map = {}
-        for game in self.playable_games:
-            color_tuple = game.get_color()
-            if color_tuple:
-                if isinstance(color_tuple, list):
-                    color_tuple = tuple(color_tuple)
-                if len(color_tuple) == 4:
-                    color_tuple = color_tuple[:3]
-                rounded_color = tuple(int(round(c / 125) * 125) for c in color_tuple)
-                color_map[rounded_color] = game
-        return color_map
+        return create_region_color_map(self.playable_games)
+
+    def _build_region_grid(self) -> RegionGrid | None:
+        """Builds the region-ID grid once from the color map at its native resolution."""
+        self.region_games = list(self.game_color_map.values())
+        try:
+            return load_region_grid(self.color_map_path, list(self.game_color_map.keys()))
+        except FileNotFoundError:
+            print(f"Error: Color map file not found at {self.color_map_path}")
+            return None
 
     def _resize_assets(self):
-        """Resizes both the background display sprite and the color map PIL image."""
+        """Resizes the background display sprite. The region grid is resolution independent."""
         if not self.window:
             print("Warning: _resize_assets called but window is not available.")
             return
@@ -97,22 +112,6 @@ class GameMenu(arcade.View):
         else:
             print("Warning: Background sprite not loaded, cannot resize.")
 
-        # Resize color map PIL image
-        if self.color_pil_image:
-            try:
-                # Use NEAREST resampling to avoid color blending/aliasing which breaks exact matching
-                self.resized_color_pil_image = self.color_pil_image.resize(
-                    (self.window.width, self.window.height),
-                    Image.Resampling.NEAREST # Crucial for keeping distinct color areas
-                )
-                # print(f"Resized color map to {self.window.width}x{self.window.height}") # Debug print
-            except Exception as e:
-                print(f"Error resizing color map image: {e}")
-                self.resized_color_pil_image = None
-        else:
-             print("Warning: Original color map PIL image not loaded, cannot resize.")
-             self.resized_color_pil_image = None
-
     def on_show_view(self):
         arcade.set_background_color(arcade.color.BLACK)
         self._resize_assets()
@@ -152,36 +151,36 @@ class GameMenu(arcade.View):
         self.waiting_for_view_score = False
         self.current_game_instance = None
 
-    def _draw_horizontal_bar(self):
+    def _update_horizontal_bar(self):
         if not self.window: return
         screen_width = self.window.width
         bar_y = 30
         bar_height = 10
         bar_margin = 20
-        arcade.draw_lrbt_rectangle_filled(bar_margin, screen_width - bar_margin,
-                                          bar_y - bar_height / 2, bar_y + bar_height / 2,
-                                          arcade.color.DARK_GRAY)
+        self.bar_shapes.set_lrbt("horizontal_bar", bar_margin, screen_width - bar_margin,
+                                 bar_y - bar_height / 2, bar_y + bar_height / 2,
+                                 arcade.color.DARK_GRAY)
         cursor_x = bar_margin + self.horizontal_cursor_pos * (screen_width - 2 * bar_margin)
         cursor_width = 5
-        arcade.draw_lrbt_rectangle_filled(cursor_x - cursor_width / 2, cursor_x + cursor_width / 2,
-                                          bar_y - bar_height, bar_y + bar_height,
-                                          arcade.color.YELLOW)
+        self.bar_shapes.set_lrbt("horizontal_cursor", cursor_x - cursor_width / 2, cursor_x + cursor_width / 2,
+                                 bar_y - bar_height, bar_y + bar_height,
+                                 arcade.color.YELLOW)
 
-    def _draw_vertical_bar(self):
+    def _update_vertical_bar(self):
         if not self.window: return
         screen_height = self.window.height
         bar_x = 30
         bar_width = 10
         bar_margin = 20
-        arcade.draw_lrbt_rectangle_filled(bar_x - bar_width / 2, bar_x + bar_width / 2,
-                                          bar_margin, screen_height - bar_margin,
-                                          arcade.color.DARK_GRAY)
+        self.bar_shapes.set_lrbt("vertical_bar", bar_x - bar_width / 2, bar_x + bar_width / 2,
+                                 bar_margin, screen_height - bar_margin,
+                                 arcade.color.DARK_GRAY)
         draw_pos = 1.0 - self.vertical_cursor_pos
         cursor_y = bar_margin + draw_pos * (screen_height - 2 * bar_margin)
         cursor_height = 5
-        arcade.draw_lrbt_rectangle_filled(bar_x - bar_width, bar_x + bar_width,
-                                          cursor_y - cursor_height / 2, cursor_y + cursor_height / 2,
-                                          arcade.color.YELLOW)
+        self.bar_shapes.set_lrbt("vertical_cursor", bar_x - bar_width, bar_x + bar_width,
+                                 cursor_y - cursor_height / 2, cursor_y + cursor_height / 2,
+                                 arcade.color.YELLOW)
 
     def on_draw(self):
         self.clear()
@@ -193,8 +192,10 @@ class GameMenu(arcade.View):
         self.score_text_object.position = (10, self.window.height - 50)
         self.score_text_object.draw()
         if self.state == "selecting":
-            self._draw_horizontal_bar()
-            self._draw_vertical_bar()
+            # Both bars and cursors go out in one batched draw call
+            self._update_horizontal_bar()
+            self._update_vertical_bar()
+            self.bar_shapes.draw()
         if self.hit_point and self.state != "game_over":
             arcade.draw_circle_outline(self.hit_point[0], self.hit_point[1], 15, arcade.color.RED, 3)
             arcade.draw_circle_filled(self.hit_point[0], self.hit_point[1], 5, arcade.color.RED)
@@ -225,6 +226,27 @@ class GameMenu(arcade.View):
         if self.state == "selecting" and not self.waiting_for_view_score:
             self._update_horizontal_cursor(delta_time)
             self._update_vertical_cursor(delta_time)
+            self._prefetch_at(*self._cursor_target())
+
+    def _cursor_target(self):
+        """Window point currently aimed at by the two cursor bars."""
+        bar_margin = 20
+        x = bar_margin + self.horizontal_cursor_pos * (self.window.width - 2 * bar_margin)
+        y = bar_margin + (1.0 - self.vertical_cursor_pos) * (self.window.height - 2 * bar_margin)
+        return x, y
+
+    def _prefetch_at(self, x, y):
+        """Starts loading the assets of the game under (x, y) in the background while the player aims."""
+        if not self.window or not self.region_grid:
+            return
+        region_id = self.region_grid.lookup(x, y, self.window.width, self.window.height)
+        if region_id == self.prefetch_region_id:
+            return
+        self.prefetch_region_id = region_id
+        game = self._game_for_region(region_id)
+        prefetch = getattr(game, "prefetch", None)
+        if prefetch:
+            prefetch((self.window.width, self.window.height))
 
     def _calculate_hit_point(self):
         if not self.window or self.selected_x is None or self.selected_y is None:
@@ -267,33 +289,18 @@ class GameMenu(arcade.View):
             self.state = "result_displayed"
 
     def _perform_throw(self):
-        """Gets the color at the hit point from the RESIZED color map, looks up the game, launches it."""
+        """Looks up the game under the hit point in the region grid and launches it."""
         if not self.window or self.hit_point is None:
             self.result_message = "Error: Cannot perform throw without window or hit point.\nPress SPACE to try again."
             self.state = "result_displayed"
             return
 
-        # Use the resized PIL image for color lookup
-        if self.resized_color_pil_image:
+        if self.region_grid:
             try:
-                img_width, img_height = self.resized_color_pil_image.size # Should match window size
-
-                # Coordinates from hit_point are already in window space.
-                # Need to clamp and adjust for PIL's coordinate system (Y=0 at top).
-                hit_x = int(self.hit_point[0])
-                hit_y = int(self.hit_point[1])
-
-                # Clamp coordinates to be within the image bounds
-                map_x = max(0, min(img_width - 1, hit_x))
-                # Invert Y for PIL coordinate system (0,0 is top-left) and clamp
-                map_y = max(0, min(img_height - 1, img_height - 1 - hit_y))
-
-                # Get pixel color from the *resized* image
-                rgb = self.resized_color_pil_image.getpixel((map_x, map_y))
-
-                # --- Color Matching Logic ---
-                # Use the fuzzy matching function
-                selected_game = self._find_closest_game(rgb) # Assuming _find_closest_game exists
+                # Hit point is in window space; the grid scales it to the map's native resolution
+                region_id = self.region_grid.lookup(self.hit_point[0], self.hit_point[1],
+                                                    self.window.width, self.window.height)
+                selected_game = self._game_for_region(region_id)
 
                 # --- Game Launch Logic ---
                 if selected_game:
@@ -311,8 +318,8 @@ class GameMenu(arcade.View):
                         if hasattr(self.window, 'game_menu_view_instance'):
                             delattr(self.window, 'game_menu_view_instance')
                 else:
-                    # No game found for the color at the hit point, even with fuzzy matching
-                    self.result_message = f"Hit color {rgb}, but no game is mapped close enough.\nTry again!\nPress SPACE to continue selecting."
+                    # The hit point is outside every mapped region
+                    self.result_message = "No game is mapped at this location.\nTry again!\nPress SPACE to continue selecting."
                     self.state = "result_displayed"
                 # --- End Game Launch Logic ---
 
@@ -321,45 +328,23 @@ class GameMenu(arcade.View):
                 print(f"Error details in _perform_throw: {e}") # More detailed logging
                 self.state = "result_displayed"
         else:
-            # Resized color map image isn't available
-            self.result_message = "Error: Resized color map image not available.\nCannot determine location.\nPress SPACE to try again."
+            # Color map couldn't be loaded so no region grid exists
+            self.result_message = "Error: Region map not available.\nCannot determine location.\nPress SPACE to try again."
             self.state = "result_displayed"
 
-    def _find_closest_game(self, target_rgb: Tuple[int, int, int], tolerance: int = 30) -> IGame | None:
-        """Finds the game associated with the color closest to target_rgb within tolerance."""
-        min_distance = float('inf')
-        closest_game = None
-
-        # Ensure game_color_map is populated
-        if not self.game_color_map:
-             print("Warning: game_color_map is empty in _find_closest_game.")
-             return None
-
-        for game_color, game_instance in self.game_color_map.items():
-            # Calculate Manhattan distance (sum of absolute differences)
-            # It's generally good enough for distinct colors and faster than Euclidean
-            distance = sum(abs(c1 - c2) for c1, c2 in zip(target_rgb, game_color))
-
-            if distance < min_distance:
-                min_distance = distance
-                closest_game = game_instance
-
-        # Only return the game if it's within the tolerance threshold
-        if min_distance <= tolerance:
-            # print(f"Debug: Target {target_rgb}, Closest {closest_game.get_color() if closest_game else 'None'}, Dist {min_distance}, Match: {closest_game.get_name() if closest_game else 'None'}")
-            return closest_game
-        else:
-            # print(f"Debug: Target {target_rgb}, Closest {closest_game.get_color() if closest_game else 'None'}, Dist {min_distance} > tolerance {tolerance}. No match.")
-            return None
+    def _game_for_region(self, region_id: int) -> IGame | None:
+        """Returns the game registered for a region ID, or None for unmapped areas."""
+        if 0 < region_id <= len(self.region_games):
+            return self.region_games[region_id - 1]
+        return None
 
     def _handle_selecting_press(self):
         if not self.window: return
-        screen_width = self.window.width
-        screen_height = self.window.height
-        bar_margin = 20
-        self.selected_x = bar_margin + self.horizontal_cursor_pos * (screen_width - 2 * bar_margin)
-        self.selected_y = bar_margin + (1.0 - self.vertical_cursor_pos) * (screen_height - 2 * bar_margin)
+        self.selected_x, self.selected_y = self._cursor_target()
         self.hit_point = self._calculate_hit_point()
+        if self.hit_point:
+            # The throw is now decided: make sure the hit game is loading while the hit is shown
+            self._prefetch_at(*self.hit_point)
         self.state = "displaying_hit"
         self.result_message = None
         self.result_text_object.text = ""
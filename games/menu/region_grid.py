@@ -0,0 +1,58 @@
+from PIL import Image, ImageChops
+from typing import List, Tuple
+
+from games.frame_cache import frame_cache
+
+NO_REGION = 0
+
+class RegionGrid:
+    """Compact uint8 region-ID index of the menu colour map.
+
+    The grid is built once at the colour map's native resolution. Cell values are
+    region IDs (1-based index into the colours given at build time, 0 = no region),
+    so resolving a throw is a single array read whatever the window size.
+    """
+
+    def __init__(self, cells_image: Image.Image):
+        self.width, self.height = cells_image.size
+        self.cells = cells_image.tobytes()
+
+    @classmethod
+    def from_color_map(cls, color_image: Image.Image, region_colors: List[Tuple[int, int, int]], tolerance: int = 30):
+        return cls(label_regions(color_image, region_colors, tolerance))
+
+    def lookup(self, x: float, y: float, view_width: int, view_height: int) -> int:
+        """Return the region ID under window point (x, y), Y pointing up as in arcade."""
+        # Sample at the window pixel's centre, like a NEAREST resize of the map would
+        col = int((int(x) + 0.5) * self.width / view_width)
+        # Grid rows are stored top to bottom like the source image
+        row = int((view_height - 1 - int(y) + 0.5) * self.height / view_height)
+        col = max(0, min(self.width - 1, col))
+        row = max(0, min(self.height - 1, row))
+        return self.cells[row * self.width + col]
+
+
+def label_regions(image: Image.Image, region_colors: List[Tuple[int, int, int]], tolerance: int = 30) -> Image.Image:
+    """Label every pixel whose Manhattan distance to a region colour is within tolerance."""
+    if len(region_colors) > 255:
+        raise ValueError("RegionGrid supports at most 255 regions")
+    channels = image.convert("RGB").split()
+    grid = Image.new("L", image.size, NO_REGION)
+    for region_id, color in enumerate(region_colors, start=1):
+        distance = None
+        for channel, target in zip(channels, color):
+            diff = channel.point(lambda v, t=target: min(abs(v - t), 255))
+            # ImageChops.add saturates at 255, which is far above any useful tolerance
+            distance = diff if distance is None else ImageChops.add(distance, diff)
+        mask = distance.point(lambda d, r=region_id: r if d <= tolerance else NO_REGION)
+        grid = ImageChops.lighter(grid, mask)
+    return grid
+
+
+def load_region_grid(color_map_path: str, region_colors: List[Tuple[int, int, int]], tolerance: int = 30) -> RegionGrid:
+    """Region grid for a colour map file, labelled once and then read back from the frame cache."""
+    key = frame_cache.key(color_map_path, extra={"regions": [list(c) for c in region_colors], "tolerance": tolerance})
+    def label():
+        with Image.open(color_map_path) as color_image:
+            return label_regions(color_image, region_colors, tolerance)
+    return RegionGrid(frame_cache.get_or_create(key, label))
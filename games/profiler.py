@@ -0,0 +1,212 @@
+"""Opt-in frame profiler: timed spans, view instrumentation, overlay and trace export.
+
+Everything is a no-op until ``profiler.enabled`` is set (``python main.py --profile``
+or ``JAM_TRAVEL_PROFILE=1``). Games can wrap their own hot paths::
+
+    from games.profiler import profiler
+
+    with profiler.span("spawn_wave"):
+        ...
+
+    @profiler.trace()
+    def update_penguin_followers(self):
+        ...
+
+``export_chrome_trace`` writes a file that chrome://tracing and ui.perfetto.dev open.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import types
+from collections import deque
+
+import arcade
+
+# View callbacks timed by ``instrument_view``
+INSTRUMENTED_EVENTS = (
+    "on_update", "on_draw",
+    "on_key_press", "on_key_release",
+    "on_mouse_press", "on_mouse_release", "on_mouse_motion", "on_mouse_scroll",
+)
+MAX_EVENTS = 500_000
+GRAPH_FRAMES = 240
+GRAPH_WIDTH = 480
+GRAPH_HEIGHT = 120
+GRAPH_MAX_MS = 50.0
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """Collects timed spans per thread, plus a rolling history of frame times.
+
+    Spans are kept as ``(name, start_ns, duration_ns, thread_id)`` in a bounded
+    deque, so a long session keeps only its most recent ``MAX_EVENTS`` spans.
+    """
+
+    def __init__(self, enabled: bool = False, max_events: int = MAX_EVENTS):
+        self.enabled = enabled
+        self.events = deque(maxlen=max_events)
+        self.frame_times = deque(maxlen=GRAPH_FRAMES)
+        self.last_frame = None
+        self.origin = time.perf_counter_ns()
+        self.thread_names = {}
+
+    def span(self, name: str):
+        """Context manager timing the enclosed block under ``name``."""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def trace(self, name: str | None = None):
+        """Decorator timing every call of a function as a span (its qualified name by default)."""
+        def decorator(function):
+            span_name = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Span(self, span_name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, start_ns: int, duration_ns: int):
+        thread = threading.current_thread()
+        if thread.ident not in self.thread_names:
+            self.thread_names[thread.ident] = thread.name
+        self.events.append((name, start_ns, duration_ns, thread.ident))
+
+    def end_frame(self):
+        """Mark the end of a displayed frame; the gap since the previous one is its frame time."""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if self.last_frame is not None:
+            self.frame_times.append((now - self.last_frame) / 1e6)
+            self.record("frame", self.last_frame, now - self.last_frame)
+        self.last_frame = now
+
+    def instrument_view(self, view: arcade.View):
+        """Wrap the view's overridden callbacks in spans named after its class, once per view."""
+        if not self.enabled or getattr(view, "_profiler_instrumented", False):
+            return
+        view._profiler_instrumented = True
+        class_name = type(view).__name__
+        for event in INSTRUMENTED_EVENTS:
+            method = getattr(type(view), event, None)
+            if method is None or method is getattr(arcade.View, event, None):
+                continue
+            # pyglet only keeps weak references to bound methods, so the wrapper must be one too
+            setattr(view, event, types.MethodType(self._wrap(f"{class_name}.{event}", method), view))
+
+    def _wrap(self, name, method):
+        @functools.wraps(method)
+        def wrapper(view, *args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return method(view, *args, **kwargs)
+            finally:
+                self.record(name, start, time.perf_counter_ns() - start)
+        return wrapper
+
+    def export_chrome_trace(self, path: str):
+        """Write the recorded spans in the Chrome trace event format."""
+        pid = os.getpid()
+        trace_events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in self.thread_names.items()
+        ]
+        for name, start, duration, tid in list(self.events):
+            trace_events.append({
+                "name": name, "ph": "X", "pid": pid, "tid": tid,
+                "ts": (start - self.origin) / 1000, "dur": duration / 1000,
+            })
+            if name == "frame":
+                trace_events.append({
+                    "name": "frame time (ms)", "ph": "C", "pid": pid,
+                    "ts": (start + duration - self.origin) / 1000, "args": {"ms": duration / 1e6},
+                })
+        with open(path, "w") as trace_file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, trace_file)
+        print(f"Wrote {len(self.events)} spans to {path}")
+
+
+class ProfilerOverlay:
+    """Rolling frame-time graph drawn in the window's top-left corner."""
+
+    def __init__(self, profiler: Profiler):
+        self.profiler = profiler
+        self.visible = False
+        self.label = arcade.Text("", 0, 0, arcade.color.WHITE, 12, anchor_y="top")
+        self.last_label = None
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def draw(self, window: arcade.Window):
+        if not self.visible or not self.profiler.frame_times:
+            return
+        window.default_camera.use()
+        left = 10
+        top = window.height - 10
+        bottom = top - GRAPH_HEIGHT
+        arcade.draw_lrbt_rectangle_filled(left, left + GRAPH_WIDTH, bottom, top, (0, 0, 0, 170))
+
+        # Reference lines at 60 and 30 FPS
+        for budget, color in ((1000 / 60, arcade.color.GREEN), (1000 / 30, arcade.color.ORANGE)):
+            y = bottom + min(budget / GRAPH_MAX_MS, 1.0) * GRAPH_HEIGHT
+            arcade.draw_line(left, y, left + GRAPH_WIDTH, y, color, 1)
+
+        frame_times = self.profiler.frame_times
+        step = GRAPH_WIDTH / (GRAPH_FRAMES - 1)
+        points = [
+            (left + i * step, bottom + min(ms / GRAPH_MAX_MS, 1.0) * GRAPH_HEIGHT)
+            for i, ms in enumerate(frame_times)
+        ]
+        if len(points) > 1:
+            arcade.draw_line_strip(points, arcade.color.WHITE, 2)
+
+        latest = frame_times[-1]
+        worst = max(frame_times)
+        label = f"frame {latest:5.1f} ms   worst {worst:5.1f} ms   F3 hide   F4 save trace"
+        if label != self.last_label:
+            self.label.text = label
+            self.last_label = label
+        self.label.x = left + 6
+        self.label.y = bottom - 4
+        self.label.draw()
+
+
+# Shared instance; main.py enables it with --profile
+profiler = Profiler(enabled=os.environ.get("JAM_TRAVEL_PROFILE") == "1")
@@ -0,0 +1,49 @@
+ROW_HEIGHT = 64
+
+
+class DuckGrid:
+    """Ducks bucketed by the horizontal rows of screen they overlap.
+
+    Ducks only ever fly sideways, so the rows a duck covers are fixed from the
+    moment it spawns: it is added once and removed once, and moving it costs the
+    grid nothing. A click falls in exactly one row, so ``at_point`` only looks at
+    the ducks flying through that row. Rows keep ducks in insertion order, which
+    makes the oldest duck under the cursor the one that is hit.
+    """
+
+    def __init__(self, row_height: int = ROW_HEIGHT):
+        self.row_height = row_height
+        self.rows = {}  # row index -> {duck: None}, an insertion-ordered set
+        self.rows_of = {}  # duck -> (first row, last row)
+
+    def __len__(self):
+        return len(self.rows_of)
+
+    def add(self, duck, half_height: float):
+        """Bucket a duck whose drawn height is ``2 * half_height``.
+
+        The height is passed in rather than read from ``duck.bottom``/``duck.top``, which
+        rebuild the sprite's hit box on every access.
+        """
+        first = int((duck.center_y - half_height) // self.row_height)
+        last = int((duck.center_y + half_height) // self.row_height)
+        for row in range(first, last + 1):
+            self.rows.setdefault(row, {})[duck] = None
+        self.rows_of[duck] = (first, last)
+
+    def remove(self, duck):
+        first, last = self.rows_of.pop(duck)
+        for row in range(first, last + 1):
+            del self.rows[row][duck]
+
+    def clear(self):
+        self.rows.clear()
+        self.rows_of.clear()
+
+    def at_point(self, x: float, y: float):
+        """Oldest duck under the point, or None."""
+        for duck in self.rows.get(int(y // self.row_height), ()):
+            # Cheap horizontal test first; only ducks level with the cursor get the exact hit box test
+            if abs(duck.center_x - x) <= duck.width / 2 and duck.collides_with_point((x, y)):
+                return duck
+        return None
@@ -3,16 +3,34 @@ import os
 import random
 from typing import Tuple
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.hud import TextLayer
+from games.usa_game.duck_grid import DuckGrid
 from arcade.types import Rect
 
+DUCK_SCALE = 0.37
+# Ducks kept on screen at once in the duck swarm stress mode
+SWARM_DUCKS = 500
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+# Every image the game loads; prefetch_assets decodes the same ones
+IMAGE_PATHS = (os.path.join(ASSETS_DIR, "usabg.jpg"), os.path.join(ASSETS_DIR, "duck.png"))
+BACKGROUND_PATH, DUCK_PATH = IMAGE_PATHS
+
 class USAGame(IGame, arcade.View):
-    def __init__(self):
+    NAME = "Duck Hunt USA"
+    COLOR = (255, 255, 255)
+
+    def __init__(self, swarm_size=0):
         super().__init__()
 
         self.title = "USA - Duck Hunt"
-        self.assets_path = os.path.join(os.path.dirname(__file__), "assets")
+        self.assets_path = ASSETS_DIR
         self.score = 0
         self.duck_list = arcade.SpriteList()
+        # Ducks by the rows they fly through, for shot tests; ducks off screen wait in the pool
+        self.duck_grid = DuckGrid()
+        self.duck_pool = []
+        self.swarm_size = swarm_size
 
         self.duck_spawn_interval = 2.0
         self.spawn_timer = 0
@@ -21,22 +39,27 @@ class USAGame(IGame, arcade.View):
         self.bullets = 5
         self.game_over = False
         self.game_over_message = ""
+        self.hud = TextLayer()
 
         self.background_texture = None
         self.background_rect = None
-        self.duck_texture_path = os.path.join(self.assets_path, "duck.png")
+        self.duck_texture_path = DUCK_PATH
+        self.duck_texture = None
         self.shot_sound = None
 
         self._load_assets()
 
     def _load_assets(self):
         try:
-            self.background_texture = arcade.load_texture(
-                os.path.join(self.assets_path, "usabg.jpg")
-            )
+            self.background_texture = assets.load_texture(BACKGROUND_PATH)
         except FileNotFoundError:
-            print(f"Warning: Background file not found at {os.path.join(self.assets_path, 'usabg.jpg')}")
+            print(f"Warning: Background file not found at {BACKGROUND_PATH}")
             self.background_texture = None
+        # Every duck shares the one texture, so they all have the same drawn size. Edges are
+        # computed from it; a sprite's left/bottom/top would rebuild its hit box each time
+        self.duck_texture = assets.load_texture(self.duck_texture_path)
+        self.duck_half_width = self.duck_texture.width * DUCK_SCALE / 2
+        self.duck_half_height = self.duck_texture.height * DUCK_SCALE / 2
         try:
             self.shot_sound = arcade.load_sound(os.path.join(self.assets_path, "shot.wav"))
         except FileNotFoundError:
@@ -46,11 +69,17 @@ class USAGame(IGame, arcade.View):
             print(f"Error loading shot sound: {e}")
             self.shot_sound = None
 
+    @staticmethod
+    def prefetch_assets(window_size=None):
+        """Decode the hunting ground and the duck ahead of the first shot."""
+        for path in IMAGE_PATHS:
+            assets.prefetch_file(path)
+
     def get_name(self) -> str:
-        return "Duck Hunt USA"
+        return self.NAME
 
     def get_color(self) -> Tuple[int, int, int]:
-        return (255, 255, 255)
+        return self.COLOR
 
     def run(self, window: arcade.Window):
         self.window = window
@@ -60,7 +89,9 @@ class USAGame(IGame, arcade.View):
 
     def setup(self):
         self.score = 0
-        self.duck_list = arcade.SpriteList()
+        while self.duck_list:
+            self.duck_pool.append(self.duck_list.pop())
+        self.duck_grid.clear()
         self.spawn_timer = 0
         self.ducks_spawned = 0
         self.bullets = 10
@@ -73,6 +104,11 @@ class USAGame(IGame, arcade.View):
                  self.background_rect = Rect(0, self.window.width, self.window.height, 0, self.window.width, self.window.height, self.window.width / 2, self.window.height / 2)
             else:
                  arcade.set_background_color(arcade.color.SKY_BLUE)
+            if self.swarm_size:
+                # The swarm never runs out of ducks, and starts spread across the screen
+                self.max_ducks = float("inf")
+                for _ in range(self.swarm_size):
+                    self._spawn_duck(random.uniform(0, self.window.width))
         else:
             print("Warning: setup() called without a window reference.")
     def on_show_view(self):
@@ -86,10 +122,11 @@ class USAGame(IGame, arcade.View):
         else:
             pass
         if self.window:
-            arcade.draw_text(f"Score: {self.score}", 10, self.window.height - 70, arcade.color.WHITE, 50)
+            self.hud.draw("score", f"Score: {self.score}", 10, self.window.height - 70, arcade.color.WHITE, 50)
             self.duck_list.draw()
             if self.game_over:
-                arcade.draw_text(
+                self.hud.draw(
+                    "game_over",
                     self.game_over_message,
                     self.window.width / 2,
                     self.window.height / 2,
@@ -101,27 +138,29 @@ class USAGame(IGame, arcade.View):
                     width=self.window.width * 0.8
                 )
         else:
-             arcade.draw_text("Error: Window not available", 100, 100, arcade.color.RED, 20)
+             self.hud.draw("error", "Error: Window not available", 100, 100, arcade.color.RED, 20)
 
     def on_update(self, delta_time: float):
         if self.game_over or not self.window:
             return
         self.spawn_timer += delta_time
         if self.spawn_timer >= self.duck_spawn_interval and self.ducks_spawned < self.max_ducks:
-            duck = arcade.Sprite(self.duck_texture_path, scale=0.37)
-            duck.center_x = 0
-            duck.center_y = random.randint(200, self.window.height - 50)
-            duck.change_x = random.randint(10, 30)
-            self.duck_list.append(duck)
+            self._spawn_duck()
             self.spawn_timer = 0
-            self.ducks_spawned += 1
-        self.duck_list.update()
-        ducks_to_remove = []
-        for duck in self.duck_list:
-            if duck.left > self.window.width:
-                ducks_to_remove.append(duck)
-        for duck in ducks_to_remove:
-             self.duck_list.remove(duck)
+        # The swarm replaces every duck that left
+        while len(self.duck_list) < self.swarm_size:
+            self._spawn_duck()
+
+        # Move and cull in one pass, walking backwards so popping a duck skips nothing
+        duck_list = self.duck_list
+        width = self.window.width
+        half_width = self.duck_half_width
+        for index in range(len(duck_list) - 1, -1, -1):
+            duck = duck_list[index]
+            duck.center_x += duck.change_x
+            if duck.center_x - half_width > width:
+                duck_list.pop(index)
+                self._release_duck(duck)
         if self.ducks_spawned == self.max_ducks and len(self.duck_list) == 0:
             self.game_over = True
             self.game_over_message = f"Game Over! Score: {self.score}\nPress SPACE to return to menu"
@@ -132,13 +171,10 @@ class USAGame(IGame, arcade.View):
         self.bullets -= 1
         if self.shot_sound:
             arcade.play_sound(self.shot_sound)
-        hit_duck = None
-        for duck in self.duck_list:
-            if duck.collides_with_point((x, y)):
-                hit_duck = duck
-                break
+        hit_duck = self.duck_grid.at_point(x, y)
         if hit_duck:
             self.duck_list.remove(hit_duck)
+            self._release_duck(hit_duck)
             self.score += 1
         game_ended = False
         if self.bullets == 0 and not self.game_over:
@@ -149,6 +185,21 @@ class USAGame(IGame, arcade.View):
              self.game_over = True
              self.game_over_message = f"Game Over! Score: {self.score}\nPress SPACE to return to menu"
 
+    def _spawn_duck(self, x=0):
+        """Send a pooled duck (or a new one) across the screen from ``x``."""
+        duck = self.duck_pool.pop() if self.duck_pool else arcade.Sprite(self.duck_texture, scale=DUCK_SCALE)
+        duck.center_x = x
+        duck.center_y = random.randint(200, self.window.height - 50)
+        duck.change_x = random.randint(10, 30)
+        self.duck_list.append(duck)
+        self.duck_grid.add(duck, self.duck_half_height)
+        self.ducks_spawned += 1
+
+    def _release_duck(self, duck):
+        """Forget a duck that was shot or flew away and keep its sprite for a later spawn."""
+        self.duck_grid.remove(duck)
+        self.duck_pool.append(duck)
+
     def on_key_press(self, key, modifiers):
         """Handle keyboard input."""
         if self.game_over and key == arcade.key.SPACE:
@@ -1,37 +1,135 @@
+import argparse
+import time
+
 import arcade
 
 from games.IGame import IGame
+from games.asset_manager import assets
+from games.frame_cache import frame_cache
+from games.game_registry import GameRegistry
+from games.profiler import profiler, ProfilerOverlay
 
 from games.europa.europa_game import EuropaGame
 from games.japan_game.japan_game import JapanGame
 from games.usa_game.usa_game import USAGame
 from games.brazil.brazil_game import BrazilGame
-from games.menu.game_menu import GameMenu
+from games.menu.game_menu import GameMenu, COLOR_MAP_PATH, create_region_color_map
+from games.menu.region_grid import load_region_grid
 from games.Antartica.antartica_game import AntarticaGame
 from games.Africa.africa_game import AfricaGame
 from games.IstanbulCat.istanbul_cat import IstanbulCat
 from games.Autralia.australie import AustralieGame
 
+
+def create_registry() -> GameRegistry:
+    """Register every minigame. Games are only built when the menu's throw selects them."""
+    registry = GameRegistry()
+    registry.register(EuropaGame)
+    registry.register(JapanGame)
+    registry.register(BrazilGame)
+    registry.register(USAGame)
+    registry.register(AntarticaGame)
+    registry.register(AfricaGame)
+    registry.register(IstanbulCat)
+    registry.register(AustralieGame)
+    return registry
+
+
+def prewarm_cache():
+    """Fill the on-disk frame cache with every pre-scaled asset, without opening a window."""
+    start = time.perf_counter()
+    registry = create_registry()
+    load_region_grid(COLOR_MAP_PATH, list(create_region_color_map(list(registry)).keys()))
+    window_size = arcade.get_display_size()
+    for game in registry:
+        game.prefetch(window_size)
+    assets.wait_for_prefetch()
+    print(f"Frame cache prewarmed in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({frame_cache.misses} entries written, {frame_cache.hits} already cached) at {frame_cache.directory}")
+
+
 class GameWindow(arcade.Window):
-    def __init__(self):
+    def __init__(self, startup_report: bool = False, trace_file: str = "trace.json"):
+        self.startup_report = startup_report
+        self.trace_file = trace_file
+        self.startup_marks = [("start", time.perf_counter())]
+        self.first_frame_drawn = False
 
         screen_width, screen_height = arcade.get_display_size()
         super().__init__(screen_width, screen_height, "EPITECH JAM TRAVEL", fullscreen=True)
-        self.playable_games = [
-            EuropaGame(),
-            JapanGame(),
-            BrazilGame(),
-            USAGame(),
-            AntarticaGame(),
-            AfricaGame(),
-            IstanbulCat(),
-            AustralieGame()
-        ]
+        self._mark("window created")
+        self.profiler_overlay = ProfilerOverlay(profiler)
+        self.registry = create_registry()
+        self.playable_games = list(self.registry)
         self.game_menu_view = GameMenu(self.playable_games, self)
+        # The menu has loaded through the shared cache; pack it into the atlas up front
+        assets.upload()
+        self._mark("menu loaded")
         self.game_menu_view_instance = self.game_menu_view
         self.show_view(self.game_menu_view)
 
+    def _mark(self, label: str):
+        self.startup_marks.append((label, time.perf_counter()))
+
+    def show_view(self, new_view: arcade.View):
+        # Instrument before the view's handlers are pushed, so the wrappers are what gets dispatched
+        profiler.instrument_view(new_view)
+        super().show_view(new_view)
+
+    def on_draw(self):
+        # Runs after the current view has drawn its frame
+        if not self.first_frame_drawn:
+            self.first_frame_drawn = True
+            self._mark("first menu frame")
+            if self.startup_report:
+                self.print_startup_report()
+        profiler.end_frame()
+        self.profiler_overlay.draw(self)
+        return super().on_draw()
+
+    def on_key_press(self, symbol: int, modifiers: int):
+        # Views don't stop key events, so these work over every game
+        if not profiler.enabled:
+            return
+        if symbol == arcade.key.F3:
+            self.profiler_overlay.toggle()
+        elif symbol == arcade.key.F4:
+            profiler.export_chrome_trace(self.trace_file)
+
+    def close(self):
+        if profiler.enabled and profiler.events:
+            profiler.export_chrome_trace(self.trace_file)
+            profiler.events.clear()
+        super().close()
+
+    def print_startup_report(self):
+        start = self.startup_marks[0][1]
+        previous = start
+        print("Startup timing report:")
+        for label, mark in self.startup_marks[1:]:
+            print(f"  {label:<18} +{(mark - previous) * 1000:8.1f} ms  ({(mark - start) * 1000:8.1f} ms total)")
+            previous = mark
+        built = [game for game in self.registry if game.is_built()]
+        print(f"  games built before first frame: {len(built)}/{len(self.registry)}")
+        for game in built:
+            print(f"    {game.get_name():<24} {game.build_time * 1000:8.1f} ms")
+
 
 if __name__ == "__main__":
-    window = GameWindow()
+    parser = argparse.ArgumentParser(description="EPITECH JAM TRAVEL")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print how long each startup phase took until the first menu frame")
+    parser.add_argument("--prewarm-cache", action="store_true",
+                        help="fill the on-disk cache of pre-scaled frames and exit")
+    parser.add_argument("--profile", action="store_true",
+                        help="record frame timings (F3 toggles the graph, F4 saves the trace)")
+    parser.add_argument("--trace-file", default="trace.json",
+                        help="Chrome/Perfetto trace written on F4 and on exit when profiling")
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enabled = True
+    if args.prewarm_cache:
+        prewarm_cache()
+        raise SystemExit(0)
+    window = GameWindow(startup_report=args.startup_report, trace_file=args.trace_file)
     arcade.run()